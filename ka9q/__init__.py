@@ -59,7 +59,7 @@ Lower-level usage (explicit control):
 __version__ = '3.14.2'
 __author__ = 'Michael Hauan AC0G'
 
-from .control import RadiodControl, allocate_ssrc
+from .control import RadiodControl, allocate_ssrc, decode_status_tlv
 from .discovery import (
     discover_channels,
     discover_channels_native,
@@ -135,6 +135,7 @@ __all__ = [
     'Filter2Status',
     'OpusStatus',
     'decode_status_packet',
+    'decode_status_tlv',
     
     # Exceptions
     'Ka9qError',
@@ -0,0 +1,394 @@
+"""TLV decoders for radiod status packets.
+
+Factored out of ``control.py`` so that ``discovery`` can import
+:func:`decode_status_tlv` at module load time: ``control`` itself imports
+``discovery``, and this module depends on neither. ``control`` re-exports
+the public ``decode_*`` functions, so ``from ka9q.control import
+decode_int`` and friends keep working.
+"""
+
+import logging
+import math
+import socket
+import struct
+from typing import Optional
+
+from .exceptions import ValidationError
+from .types import StatusType
+
+logger = logging.getLogger(__name__)
+
+# Precompiled fixed-width layouts for the TLV decoders. A struct.Struct
+# parses its format string once; module-level struct.unpack() re-parses
+# it on every call, which adds up over the dozens of TLVs in a status frame.
+_U32 = struct.Struct('>I')
+_F32 = struct.Struct('>f')
+_F64 = struct.Struct('>d')
+
+
+def decode_int(data: bytes, length: int) -> int:
+    """
+    Decode an integer from TLV response
+    
+    Args:
+        data: Bytes to decode (variable length, big-endian)
+        length: Number of bytes
+        
+    Returns:
+        Integer value
+        
+    Raises:
+        ValidationError: If length is negative or data is insufficient
+    """
+    # Validate length
+    if length < 0:
+        raise ValidationError(f"Negative length in decode_int: {length}")
+    if length == 0:
+        return 0
+    if length > 8:
+        logger.warning(f"Integer length {length} exceeds 8 bytes, truncating")
+        length = 8
+    if len(data) < length:
+        raise ValidationError(f"Insufficient data: need {length} bytes, have {len(data)}")
+    
+    return int.from_bytes(data[:length], 'big')
+
+
+def decode_int32(data: bytes, length: int) -> int:
+    """
+    Decode a 32-bit integer from TLV response (alias for decode_int)
+    
+    Args:
+        data: Bytes to decode (variable length, big-endian)
+        length: Number of bytes
+        
+    Returns:
+        Integer value
+    """
+    # Full-width 32-bit fields are the common case (SSRC, command tag)
+    if length == 4 and len(data) >= 4:
+        return _U32.unpack_from(data)[0]
+    return decode_int(data, length)
+
+
+def decode_int64(data: bytes, length: int) -> int:
+    """
+    Decode a 64-bit integer from TLV response (alias for decode_int)
+    
+    Args:
+        data: Bytes to decode (variable length, big-endian)
+        length: Number of bytes
+        
+    Returns:
+        Integer value (up to 64-bit)
+    """
+    return decode_int(data, length)
+
+
+def decode_float(data: bytes, length: int) -> float:
+    """
+    Decode a float (float32) from TLV response
+    
+    Args:
+        data: Bytes to decode (big-endian IEEE 754)
+        length: Number of bytes (should be 4 or less with leading zeros stripped)
+        
+    Returns:
+        Float value
+        
+    Raises:
+        ValidationError: If length is negative or data is insufficient
+    """
+    # Validate length
+    if length < 0:
+        raise ValidationError(f"Negative length in decode_float: {length}")
+    if length > 4:
+        logger.warning(f"Float length {length} exceeds 4 bytes, truncating")
+        length = 4
+    if len(data) < length:
+        raise ValidationError(f"Insufficient data: need {length} bytes, have {len(data)}")
+    
+    if length == 4:
+        return _F32.unpack_from(data)[0]
+    if length == 0:
+        # 0.0 is sent with zero length; common in status frames
+        return 0.0
+    
+    # Reconstruct 4-byte big-endian representation
+    value_bytes = b'\x00' * (4 - length) + data[:length]
+    return _F32.unpack(value_bytes)[0]
+
+
+def decode_double(data: bytes, length: int) -> float:
+    """
+    Decode a double (float64) from TLV response
+    
+    Args:
+        data: Bytes to decode (big-endian IEEE 754)
+        length: Number of bytes (should be 8 or less with leading zeros stripped)
+        
+    Returns:
+        Float value
+        
+    Raises:
+        ValidationError: If length is negative or data is insufficient
+    """
+    # Validate length
+    if length < 0:
+        raise ValidationError(f"Negative length in decode_double: {length}")
+    if length > 8:
+        logger.warning(f"Double length {length} exceeds 8 bytes, truncating")
+        length = 8
+    if len(data) < length:
+        raise ValidationError(f"Insufficient data: need {length} bytes, have {len(data)}")
+    
+    if length == 8:
+        return _F64.unpack_from(data)[0]
+    if length == 0:
+        # 0.0 is sent with zero length; common in status frames
+        return 0.0
+    
+    # Reconstruct 8-byte big-endian representation
+    value_bytes = b'\x00' * (8 - length) + data[:length]
+    return _F64.unpack(value_bytes)[0]
+
+
+def decode_bool(data: bytes, length: int) -> bool:
+    """
+    Decode a boolean value from TLV response
+    
+    Args:
+        data: Bytes to decode
+        length: Number of bytes
+        
+    Returns:
+        True if non-zero, False if zero
+    """
+    return decode_int(data, length) != 0
+
+
+def decode_string(data: bytes, length: int) -> str:
+    """
+    Decode a UTF-8 string from TLV response
+    
+    Args:
+        data: Bytes to decode
+        length: String length in bytes
+        
+    Returns:
+        Decoded string
+        
+    Raises:
+        ValidationError: If length is negative or data is insufficient
+    """
+    # Validate length
+    if length < 0:
+        raise ValidationError(f"Negative length in decode_string: {length}")
+    if length > 65535:
+        logger.warning(f"String length {length} exceeds maximum, truncating to 65535")
+        length = 65535
+    if len(data) < length:
+        logger.warning(f"String data truncated: expected {length} bytes, have {len(data)}")
+        length = len(data)
+    
+    # str() rather than .decode() so memoryview slices work too
+    return str(data[:length], 'utf-8', 'replace')
+
+
+def _decode_sockaddr_with_family(family: int, port: int, addr: bytes) -> dict:
+    # family(2) + port(2) + address(4); only AF_INET (2) is meaningful here
+    if family == 2:
+        return {'family': 'IPv4', 'address': socket.inet_ntoa(addr), 'port': port}
+    return {'family': f'unknown (family={family})', 'address': '', 'port': port}
+
+
+def _decode_sockaddr_ipv4(addr: bytes, port: int) -> dict:
+    # address(4) + port(2)
+    return {'family': 'IPv4', 'address': socket.inet_ntoa(addr), 'port': port}
+
+
+def _decode_sockaddr_ipv6_truncated(addr: bytes, port: int) -> dict:
+    # address(8) + port(2): a truncated IPv6 address (only 8 of 16 bytes),
+    # so it is formatted as hex groups rather than through inet_ntop
+    address = ':'.join(f'{addr[i]:02x}{addr[i+1]:02x}' for i in range(0, 8, 2))
+    return {'family': 'IPv6', 'address': address, 'port': port}
+
+
+# decode_socket() layouts keyed by TLV length: (struct, handler)
+_SOCKADDR_DECODERS = {
+    8: (struct.Struct('>HH4s'), _decode_sockaddr_with_family),
+    6: (struct.Struct('>4sH'), _decode_sockaddr_ipv4),
+    10: (struct.Struct('>8sH'), _decode_sockaddr_ipv6_truncated),
+}
+
+
+def decode_socket(data: bytes, length: int) -> dict:
+    """
+    Decode a socket address from TLV response
+    
+    Args:
+        data: Bytes containing socket address
+        length: Length of socket data
+        
+    Returns:
+        Dictionary with 'family', 'address', and 'port' keys
+    
+    Note:
+        Handles two formats:
+        - With family field: 2 bytes family + 2 bytes port + N bytes address (length 8 for IPv4, 18 for IPv6)
+        - Without family field: N bytes address + 2 bytes port (length 6 for IPv4, 10 for IPv6)
+    """
+    decoder = _SOCKADDR_DECODERS.get(length)
+    if decoder is None:
+        return {'family': 'unknown', 'address': '', 'port': 0}
+    layout, handler = decoder
+    return handler(*layout.unpack_from(data))
+
+
+def _extended_len(buffer: bytes, cp: int, optlen: int) -> tuple:
+    """
+    Decode a multi-byte TLV length
+    
+    Args:
+        buffer: Packet being parsed
+        cp: Offset just past the length byte
+        optlen: The length byte, with its top bit set; the low 7 bits give
+                the number of big-endian length bytes that follow
+    
+    Returns:
+        ``(length, offset of the value)``; a length cut short by the end of
+        the packet is decoded from the bytes that are there
+    """
+    end = cp + (optlen & 0x7f)
+    return int.from_bytes(buffer[cp:end], 'big'), min(end, len(buffer))
+
+
+# dB -> natural-log scale factor for _snr_db()
+_LN10_OVER_10 = math.log(10) / 10
+
+# Status fields _snr_db() needs before decode_status_tlv() reports 'snr'
+_SNR_INPUTS = frozenset(('baseband_power', 'noise_density', 'low_edge', 'high_edge'))
+
+
+def _snr_db(baseband_power: float, noise_density: float,
+            low_edge: float, high_edge: float) -> Optional[float]:
+    """
+    Channel S/N in dB from radiod's power, noise density and filter edges
+    
+    Returns:
+        SNR in dB, or None if the filter is empty or the signal is not
+        above the noise
+    """
+    bandwidth = abs(high_edge - low_edge)
+    
+    # Guard against invalid bandwidth
+    if bandwidth <= 0:
+        return None
+    noise_power_db = noise_density + 10 * math.log10(bandwidth)
+    
+    # (S+N)/N - 1 = 10**(d/10) - 1 with d the excess over the noise in dB;
+    # expm1() evaluates that without two 10** round trips and stays
+    # accurate when the signal is barely above the noise
+    excess_db = baseband_power - noise_power_db
+    if not excess_db > 0:
+        return None
+    try:
+        return 10 * math.log10(math.expm1(excess_db * _LN10_OVER_10))
+    except OverflowError:
+        # Far above the noise floor the -1 is irrelevant
+        return excess_db
+
+
+# Status TLVs surfaced by decode_status_tlv(): type -> (key, decoder,
+# layout). When the field arrives at full width, layout reads it in place.
+_STATUS_FIELDS = {
+    StatusType.COMMAND_TAG: ('command_tag', decode_int32, _U32),
+    StatusType.GPS_TIME: ('gps_time', decode_int64, None),
+    StatusType.RTP_TIMESNAP: ('rtp_timesnap', decode_int32, _U32),
+    StatusType.RADIO_FREQUENCY: ('frequency', decode_double, _F64),
+    StatusType.OUTPUT_SSRC: ('ssrc', decode_int32, _U32),
+    StatusType.AGC_ENABLE: ('agc_enable', decode_bool, None),
+    StatusType.GAIN: ('gain', decode_float, _F32),
+    StatusType.RF_GAIN: ('rf_gain', decode_float, _F32),
+    StatusType.RF_ATTEN: ('rf_atten', decode_float, _F32),
+    StatusType.RF_AGC: ('rf_agc', decode_int, None),
+    StatusType.PRESET: ('preset', decode_string, None),
+    StatusType.LOW_EDGE: ('low_edge', decode_float, _F32),
+    StatusType.HIGH_EDGE: ('high_edge', decode_float, _F32),
+    StatusType.NOISE_DENSITY: ('noise_density', decode_float, _F32),
+    StatusType.BASEBAND_POWER: ('baseband_power', decode_float, _F32),
+    StatusType.OUTPUT_SAMPRATE: ('sample_rate', decode_int, None),
+    StatusType.OUTPUT_ENCODING: ('encoding', decode_int, None),
+    StatusType.OUTPUT_DATA_DEST_SOCKET: ('destination', decode_socket, None),
+    StatusType.OUTPUT_TTL: ('ttl', decode_int, None),
+    StatusType.LIFETIME: ('lifetime', decode_int, None),
+    StatusType.DESCRIPTION: ('description', decode_string, None),
+}
+
+
+def decode_status_tlv(buffer: bytes) -> dict:
+    """
+    Decode a status response packet from radiod into a flat dict
+
+    Pure function of the buffer so it can be shared by every receive
+    loop without going through a RadiodControl instance.
+
+    Args:
+        buffer: Raw response bytes
+
+    Returns:
+        Dictionary containing decoded status fields (empty if the buffer
+        is not a status packet)
+    """
+    status = {}
+    
+    if len(buffer) == 0 or buffer[0] != 0:
+        return status  # Not a status response
+    
+    cp = 1  # Skip packet type byte
+    n = len(buffer)
+    fields = _STATUS_FIELDS
+    # Slices of a memoryview are views, so field payloads are not copied
+    mv = memoryview(buffer)
+    
+    while cp < n:
+        type_val = buffer[cp]
+        cp += 1
+        
+        if type_val == StatusType.EOL:
+            break
+        
+        if cp >= n:
+            break
+        
+        optlen = buffer[cp]
+        cp += 1
+        
+        # Short lengths (nearly all of them) are the byte itself
+        if optlen & 0x80:
+            optlen, cp = _extended_len(buffer, cp, optlen)
+        
+        if cp + optlen > n:
+            break
+        
+        handler = fields.get(type_val)
+        if handler is not None:
+            key, decode, layout = handler
+            if layout is not None and optlen == layout.size:
+                status[key] = layout.unpack_from(buffer, cp)[0]
+            else:
+                status[key] = decode(mv[cp:cp + optlen], optlen)
+
+        cp += optlen
+    
+    if status.get('ttl') == 0:
+        logger.warning(f"Radiod reporting TTL=0 for SSRC {status.get('ssrc', 'unknown')}: Multicast data restricted to localhost loopback only!")
+    
+    # Calculate SNR if we have the necessary data
+    if _SNR_INPUTS <= status.keys():
+        snr = _snr_db(status['baseband_power'], status['noise_density'],
+                      status['low_edge'], status['high_edge'])
+        if snr is not None:
+            status['snr'] = snr
+
+    return status
@@ -20,23 +20,146 @@ PARAMETERS:
 - See individual methods for parameter descriptions and valid ranges
 """
 
+import ctypes
+import errno
+import os
 import socket
 import struct
 import secrets
 import logging
 import threading
 import hashlib
+import itertools
 import re
 import time
+import select
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Union
+from typing import Optional, Dict, List, Union
 from .types import StatusType, CMD
 from .discovery import discover_channels
 from .exceptions import ConnectionError, CommandError, ValidationError
 from .utils import resolve_multicast_address
+from .addressing import generate_multicast_ip
+from .status import decode_status_packet
+from ._status_decoder import (
+    _F32, _F64, _extended_len,
+    decode_int, decode_int32, decode_int64, decode_float, decode_double,
+    decode_bool, decode_string, decode_socket, decode_status_tlv,
+)
 
 logger = logging.getLogger(__name__)
 
+# struct ip_mreq (group address, interface address) and INADDR_ANY, used
+# when joining the status multicast group
+_IP_MREQ = struct.Struct('=4s4s')
+_INADDR_ANY = socket.inet_aton('0.0.0.0')
+
+# Linux can create a socket non-blocking in one call; elsewhere this is 0
+# and _setup_status_listener() falls back to setblocking(False)
+_SOCK_NONBLOCK = getattr(socket, 'SOCK_NONBLOCK', 0)
+
+
+# struct iovec / msghdr / mmsghdr for sendmmsg(2). The socket is connected,
+# so msg_name stays NULL and each message is a single iovec.
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_IOVec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    """libc's sendmmsg(), or None where the platform lacks it (non-Linux)"""
+    try:
+        # CDLL(None) searches the symbols already loaded into the process,
+        # which include libc, without find_library()'s ldconfig subprocess
+        fn = ctypes.CDLL(None, use_errno=True).sendmmsg
+    except (OSError, AttributeError, TypeError):
+        return None
+    fn.argtypes = (ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int)
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_sendmmsg()
+
+
+def _send_packets(sock: socket.socket, packets: List[bytes]) -> int:
+    """
+    Send datagrams on a connected socket, in order
+    
+    Uses a single sendmmsg() call on Linux (more only if the kernel accepts
+    part of the batch) and one send() per packet elsewhere.
+    
+    Returns:
+        Number of packets sent; fewer than ``len(packets)`` if sending
+        failed part way, in which case the rest were not sent
+    """
+    if _sendmmsg is None:
+        for i, packet in enumerate(packets):
+            try:
+                sock.send(packet)
+            except OSError as e:
+                logger.debug("Batched send stopped at packet %d: %s", i, e)
+                return i
+        return len(packets)
+    
+    n = len(packets)
+    bufs = [ctypes.create_string_buffer(packet, len(packet)) for packet in packets]
+    iovs = (_IOVec * n)()
+    msgs = (_MMsgHdr * n)()
+    for i, (buf, packet) in enumerate(zip(bufs, packets)):
+        iovs[i].iov_base = ctypes.addressof(buf)
+        iovs[i].iov_len = len(packet)
+        msgs[i].msg_hdr.msg_iov = ctypes.pointer(iovs[i])
+        msgs[i].msg_hdr.msg_iovlen = 1
+    
+    fd = sock.fileno()
+    base = ctypes.addressof(msgs)
+    size = ctypes.sizeof(_MMsgHdr)
+    done = 0
+    while done < n:
+        sent = _sendmmsg(fd, base + done * size, n - done, 0)
+        if sent < 0:
+            err = ctypes.get_errno()
+            if err == errno.EINTR:
+                continue
+            logger.debug("Batched send stopped at packet %d: %s", done, os.strerror(err))
+            break
+        done += sent
+    return done
+
+
+# Command tags only need to be unique enough to correlate a reply with its
+# command, not unpredictable. A counter seeded once from the OS CSPRNG avoids
+# a getrandom() syscall per command while still starting each process at a
+# random point so concurrent clients don't collide.
+_tag_counter = itertools.count(secrets.randbits(31))
+
+
+def next_command_tag() -> int:
+    """
+    Return the next 31-bit command tag
+    
+    Shared by every module that builds radiod commands, so tags from one
+    process never repeat within the counter's 2**31 cycle.
+    """
+    return next(_tag_counter) & 0x7fffffff
+
 
 @dataclass
 class Metrics:
@@ -146,6 +269,42 @@ def _validate_frequency(freq_hz: float) -> None:
         raise ValidationError(f"Invalid frequency: {freq_hz} Hz (must be 0 < freq < 10 THz)")
 
 
+def _validate_ssrc_frequency(ssrc: int, freq_hz: float) -> None:
+    """
+    Validate an SSRC and frequency pair for a frequency command
+    
+    Exact type checks cover the common case in one expression; anything
+    else (bool, int subclasses, out-of-range values) falls through to the
+    individual validators for their error messages.
+    """
+    if (type(ssrc) is int and 0 <= ssrc <= 0xFFFFFFFF
+            and type(freq_hz) in (float, int) and 0 < freq_hz < 10e12):
+        return
+    _validate_ssrc(ssrc)
+    _validate_frequency(freq_hz)
+
+
+def _validate_channel_request(ssrc: int, freq_hz: float,
+                              sample_rate: Optional[int], gain_db: float) -> None:
+    """
+    Validate create_channel()'s numeric parameters in one call
+    
+    Same approach as _validate_ssrc_frequency(): one exact-type expression
+    for the common case, falling through to the individual validators (in
+    their usual order) for anything else. ``sample_rate`` may be None.
+    """
+    if (type(ssrc) is int and 0 <= ssrc <= 0xFFFFFFFF
+            and type(freq_hz) in (float, int) and 0 < freq_hz < 10e12
+            and (sample_rate is None or (type(sample_rate) is int and 1 <= sample_rate <= 100e6))
+            and type(gain_db) in (float, int) and -100 <= gain_db <= 100):
+        return
+    _validate_ssrc(ssrc)
+    _validate_frequency(freq_hz)
+    if sample_rate is not None:
+        _validate_sample_rate(sample_rate)
+    _validate_gain(gain_db)
+
+
 def _validate_sample_rate(rate: int) -> None:
     """Validate sample rate is positive and reasonable"""
     if not isinstance(rate, int):
@@ -178,6 +337,16 @@ def _validate_positive(value: float, name: str) -> None:
         raise ValidationError(f"{name} must be positive, got {value}")
 
 
+# Preset names are restricted to this charset; compiled once rather than
+# looked up in re's pattern cache on every command.
+_PRESET_RE = re.compile(r'\A[A-Za-z0-9_\-]+\Z')
+
+# Control characters rejected by the string validators. Scanning with a
+# compiled character class runs in C instead of a per-character ord() loop.
+_PRESET_CTRL_RE = re.compile(r'[\x00-\x1f\x7f]')
+_PARAM_CTRL_RE = re.compile(r'[\x00-\x08\x0b-\x1f]')  # allows \t and \n
+
+
 def _validate_preset(preset: str) -> None:
     """
     Validate preset name is safe and within reasonable bounds
@@ -195,10 +364,10 @@ def _validate_preset(preset: str) -> None:
     if len(preset) > 32:
         raise ValidationError(f"Preset name too long: {len(preset)} chars (max 32)")
     # Check control characters FIRST (before regex)
-    if any(ord(c) < 32 or ord(c) == 127 for c in preset):
+    if _PRESET_CTRL_RE.search(preset):
         raise ValidationError(f"Preset name contains control characters")
     # Allow alphanumeric, dash, underscore only
-    if not re.match(r'^[a-zA-Z0-9_-]+$', preset):
+    if not _PRESET_RE.match(preset):
         raise ValidationError(f"Invalid preset name '{preset}': only alphanumeric, dash, and underscore allowed")
 
 
@@ -224,7 +393,7 @@ def _validate_string_param(value: str, param_name: str, max_length: int = 256) -
     if '\x00' in value:
         raise ValidationError(f"{param_name} contains null bytes")
     # Then check other control characters (except newline/tab if needed)
-    if any(ord(c) < 32 and c not in '\n\t' for c in value):
+    if _PARAM_CTRL_RE.search(value):
         raise ValidationError(f"{param_name} contains control characters")
 
 
@@ -283,18 +452,10 @@ def encode_int64(buf: bytearray, type_val: int, x: int) -> int:
         buf.append(0)
         return 2
     
-    # Convert to bytes and remove leading zeros
-    x_bytes = x.to_bytes(8, byteorder='big')
-    # Find first non-zero byte
-    start = 0
-    while start < len(x_bytes) and x_bytes[start] == 0:
-        start += 1
-    
-    value_bytes = x_bytes[start:]
-    length = len(value_bytes)
-    
+    # Emit only the significant bytes (leading zeros compressed)
+    length = (x.bit_length() + 7) >> 3
     buf.append(length)
-    buf.extend(value_bytes)
+    buf.extend(x.to_bytes(length, byteorder='big'))
     
     return 2 + length
 
@@ -337,10 +498,15 @@ def encode_double(buf: bytearray, type_val: int, x: float) -> int:
         >>> encode_double(buf, StatusType.RADIO_FREQUENCY, 14.074e6)
         10
     """
-    # Pack as double, unpack as uint64
-    packed = struct.pack('>d', x)  # big-endian double
-    value = struct.unpack('>Q', packed)[0]  # big-endian uint64
-    return encode_int64(buf, type_val, value)
+    packed = _F64.pack(x)  # big-endian double
+    if packed[0]:
+        # No leading zero bytes to compress (any normal non-zero value
+        # outside the tiny-exponent range): emit the full 8 bytes directly
+        buf.append(type_val)
+        buf.append(8)
+        buf.extend(packed)
+        return 10
+    return encode_int64(buf, type_val, int.from_bytes(packed, 'big'))
 
 
 def encode_float(buf: bytearray, type_val: int, x: float) -> int:
@@ -362,10 +528,14 @@ def encode_float(buf: bytearray, type_val: int, x: float) -> int:
         Single-precision floats have less precision than doubles.
         Use encode_double() for better precision when needed.
     """
-    # Pack as float, unpack as uint32
-    packed = struct.pack('>f', x)  # big-endian float
-    value = struct.unpack('>I', packed)[0]  # big-endian uint32
-    return encode_int64(buf, type_val, value)
+    packed = _F32.pack(x)  # big-endian float
+    if packed[0]:
+        # No leading zero bytes to compress: emit the full 4 bytes directly
+        buf.append(type_val)
+        buf.append(4)
+        buf.extend(packed)
+        return 6
+    return encode_int64(buf, type_val, int.from_bytes(packed, 'big'))
 
 
 def encode_string(buf: bytearray, type_val: int, s: str) -> int:
@@ -410,6 +580,10 @@ def encode_string(buf: bytearray, type_val: int, s: str) -> int:
     return 2 + length
 
 
+# Whole IPv4 socket TLV: type, length (6), address(4), port(2)
+_SOCKADDR_IPV4_TLV = struct.Struct('>BB4sH')
+
+
 def encode_socket(buf: bytearray, type_val: int, address: str, port: int = 5004) -> int:
     """
     Encode a socket address (IPv4) in TLV format
@@ -440,8 +614,6 @@ def encode_socket(buf: bytearray, type_val: int, address: str, port: int = 5004)
         >>> encode_socket(buf, StatusType.OUTPUT_DATA_DEST_SOCKET, "239.1.2.3", 5004)
         8
     """
-    buf.append(type_val)
-    
     # Encode the socket address
     try:
         # Convert string IP to 4 bytes (already in network order)
@@ -455,9 +627,7 @@ def encode_socket(buf: bytearray, type_val: int, address: str, port: int = 5004)
     
     # Format: address(4 bytes) + port(2 bytes, network order)
     # This matches radiod's decode_socket() expectations
-    buf.append(6)  # length for IPv4
-    buf.extend(addr_bytes)  # 4 bytes address (already in network order from inet_aton)
-    buf.extend(struct.pack('>H', port))  # 2 bytes port (big-endian)
+    buf.extend(_SOCKADDR_IPV4_TLV.pack(type_val, 6, addr_bytes, port))
     
     return 2 + 6  # type + length + data
 
@@ -479,207 +649,94 @@ def encode_eol(buf: bytearray) -> int:
     return 1
 
 
-# Decode functions for parsing TLV responses
-
-def decode_int(data: bytes, length: int) -> int:
-    """
-    Decode an integer from TLV response
-    
-    Args:
-        data: Bytes to decode (variable length, big-endian)
-        length: Number of bytes
-        
-    Returns:
-        Integer value
-        
-    Raises:
-        ValidationError: If length is negative or data is insufficient
-    """
-    # Validate length
-    if length < 0:
-        raise ValidationError(f"Negative length in decode_int: {length}")
-    if length == 0:
-        return 0
-    if length > 8:
-        logger.warning(f"Integer length {length} exceeds 8 bytes, truncating")
-        length = 8
-    if len(data) < length:
-        raise ValidationError(f"Insufficient data: need {length} bytes, have {len(data)}")
-    
-    value = 0
-    for i in range(length):
-        value = (value << 8) | data[i]
-    return value
-
-
-def decode_int32(data: bytes, length: int) -> int:
-    """
-    Decode a 32-bit integer from TLV response (alias for decode_int)
-    
-    Args:
-        data: Bytes to decode (variable length, big-endian)
-        length: Number of bytes
-        
-    Returns:
-        Integer value
-    """
-    return decode_int(data, length)
+# Every command carries the same boilerplate: a command tag and the EOL
+# trailer. Building them from prebuilt bytes skips a function call and the
+# leading-zero scan per command. The tag is always sent at its full 4-byte
+# width, which radiod's decoder accepts just as it does a compressed one.
+_EOL = bytes((StatusType.EOL,))
+_TAG_TLV = struct.Struct('>BBI')
+_T_TAG = StatusType.COMMAND_TAG
+_T_SSRC = StatusType.OUTPUT_SSRC
 
+# Fields whose change makes verify_channel()'s snapshot of a channel stale
+_RETUNE_TYPES = frozenset((StatusType.RADIO_FREQUENCY, StatusType.PRESET))
 
-def decode_int64(data: bytes, length: int) -> int:
-    """
-    Decode a 64-bit integer from TLV response (alias for decode_int)
-    
-    Args:
-        data: Bytes to decode (variable length, big-endian)
-        length: Number of bytes
-        
-    Returns:
-        Integer value (up to 64-bit)
-    """
-    return decode_int(data, length)
+# tune() keyword arguments a tune_many() request may carry besides 'ssrc'
+_TUNE_PARAMS = frozenset((
+    'frequency_hz', 'preset', 'sample_rate', 'low_edge', 'high_edge',
+    'gain', 'agc_enable', 'rf_gain', 'rf_atten', 'encoding',
+    'destination', 'lifetime',
+))
 
 
-def decode_float(data: bytes, length: int) -> float:
-    """
-    Decode a float (float32) from TLV response
-    
-    Args:
-        data: Bytes to decode (big-endian IEEE 754)
-        length: Number of bytes (should be 4 or less with leading zeros stripped)
-        
-    Returns:
-        Float value
-        
-    Raises:
-        ValidationError: If length is negative or data is insufficient
-    """
-    # Validate length
-    if length < 0:
-        raise ValidationError(f"Negative length in decode_float: {length}")
-    if length > 4:
-        logger.warning(f"Float length {length} exceeds 4 bytes, truncating")
-        length = 4
-    if len(data) < length:
-        raise ValidationError(f"Insufficient data: need {length} bytes, have {len(data)}")
-    
-    # Reconstruct 4-byte big-endian representation
-    value_bytes = b'\x00' * (4 - length) + data[:length]
-    return struct.unpack('>f', value_bytes)[0]
+def _encode_tag(buf: bytearray, tag: int) -> None:
+    """Append a COMMAND_TAG TLV with a fixed 4-byte value"""
+    buf.extend(_TAG_TLV.pack(_T_TAG, 4, tag))
 
 
-def decode_double(data: bytes, length: int) -> float:
-    """
-    Decode a double (float64) from TLV response
-    
-    Args:
-        data: Bytes to decode (big-endian IEEE 754)
-        length: Number of bytes (should be 8 or less with leading zeros stripped)
-        
-    Returns:
-        Float value
-        
-    Raises:
-        ValidationError: If length is negative or data is insufficient
-    """
-    # Validate length
-    if length < 0:
-        raise ValidationError(f"Negative length in decode_double: {length}")
-    if length > 8:
-        logger.warning(f"Double length {length} exceeds 8 bytes, truncating")
-        length = 8
-    if len(data) < length:
-        raise ValidationError(f"Insufficient data: need {length} bytes, have {len(data)}")
-    
-    # Reconstruct 8-byte big-endian representation
-    value_bytes = b'\x00' * (8 - length) + data[:length]
-    return struct.unpack('>d', value_bytes)[0]
+# Complete poll command (CMD, COMMAND_TAG, OUTPUT_SSRC, EOL) as one fixed
+# layout: only the tag and SSRC change between polls, so they are packed
+# straight into place rather than encoded TLV by TLV
+_POLL_CMD = struct.Struct('>BBBIBBIB')
 
 
-def decode_bool(data: bytes, length: int) -> bool:
-    """
-    Decode a boolean value from TLV response
-    
-    Args:
-        data: Bytes to decode
-        length: Number of bytes
-        
-    Returns:
-        True if non-zero, False if zero
-    """
-    return decode_int(data, length) != 0
+def _build_poll_command(ssrc: int, tag: int) -> bytearray:
+    """Build an SSRC-only poll command, which radiod answers with full status"""
+    return bytearray(_POLL_CMD.pack(CMD, _T_TAG, 4, tag, _T_SSRC, 4, ssrc, StatusType.EOL))
 
 
-def decode_string(data: bytes, length: int) -> str:
-    """
-    Decode a UTF-8 string from TLV response
-    
-    Args:
-        data: Bytes to decode
-        length: String length in bytes
-        
-    Returns:
-        Decoded string
-        
-    Raises:
-        ValidationError: If length is negative or data is insufficient
-    """
-    # Validate length
-    if length < 0:
-        raise ValidationError(f"Negative length in decode_string: {length}")
-    if length > 65535:
-        logger.warning(f"String length {length} exceeds maximum, truncating to 65535")
-        length = 65535
-    if len(data) < length:
-        logger.warning(f"String data truncated: expected {length} bytes, have {len(data)}")
-        length = len(data)
-    
-    return data[:length].decode('utf-8', errors='replace')
+# Field kinds accepted by RadiodControl._send_tlv()
+_TLV_ENCODERS = {
+    'i': encode_int64,
+    'd': encode_double,
+    'f': encode_float,
+    's': encode_string,
+}
 
 
-def decode_socket(data: bytes, length: int) -> dict:
+def _peek_ssrc_tag(buffer: bytes) -> Optional[tuple]:
     """
-    Decode a socket address from TLV response
+    Read which command a status packet answers, without decoding it
+    
+    Walks the TLVs only as far as needed to read OUTPUT_SSRC and
+    COMMAND_TAG, so packets for other channels or commands are rejected
+    without the full decode_status_tlv() pass.
     
     Args:
-        data: Bytes containing socket address
-        length: Length of socket data
-        
-    Returns:
-        Dictionary with 'family', 'address', and 'port' keys
+        buffer: Raw packet bytes
     
-    Note:
-        Handles two formats:
-        - With family field: 2 bytes family + 2 bytes port + N bytes address (length 8 for IPv4, 18 for IPv6)
-        - Without family field: N bytes address + 2 bytes port (length 6 for IPv4, 10 for IPv6)
+    Returns:
+        ``(ssrc, command_tag)``, or None if this is not a status packet or
+        lacks either field
     """
-    if length == 8:
-        # Format WITH family field: family(2) + port(2) + address(4) for IPv4
-        family = struct.unpack('>H', data[0:2])[0]
-        port = struct.unpack('>H', data[2:4])[0]
-        # Check if it's actually IPv4 (AF_INET = 2)
-        if family == 2:
-            address = socket.inet_ntoa(data[4:8])
-            return {'family': 'IPv4', 'address': address, 'port': port}
+    n = len(buffer)
+    if n == 0 or buffer[0] != 0:
+        return None
+    
+    cp = 1
+    ssrc = tag = None
+    while cp + 1 < n:
+        type_val = buffer[cp]
+        if type_val == StatusType.EOL:
+            break
+        optlen = buffer[cp + 1]
+        cp += 2
+        if optlen & 0x80:
+            optlen, cp = _extended_len(buffer, cp, optlen)
+        if cp + optlen > n:
+            break
+        
+        if type_val == _T_SSRC:
+            ssrc = int.from_bytes(buffer[cp:cp + optlen], 'big')
+        elif type_val == _T_TAG:
+            tag = int.from_bytes(buffer[cp:cp + optlen], 'big')
         else:
-            # Unknown family
-            return {'family': f'unknown (family={family})', 'address': '', 'port': port}
-    elif length == 6:
-        # Format WITHOUT family field: address(4) + port(2) for IPv4
-        address = socket.inet_ntoa(data[0:4])
-        port = struct.unpack('>H', data[4:6])[0]
-        return {'family': 'IPv4', 'address': address, 'port': port}
-    elif length == 10:
-        # Format WITHOUT family field: address(8) + port(2) for IPv6 (truncated)
-        # Note: This is a truncated IPv6 address (only 8 bytes instead of 16)
-        address_bytes = data[0:8]
-        port = struct.unpack('>H', data[8:10])[0]
-        # Format as hex string since it's truncated
-        address = ':'.join(f'{address_bytes[i]:02x}{address_bytes[i+1]:02x}' 
-                          for i in range(0, 8, 2))
-        return {'family': 'IPv6', 'address': address, 'port': port}
-    else:
-        return {'family': 'unknown', 'address': '', 'port': 0}
+            cp += optlen
+            continue
+        if ssrc is not None and tag is not None:
+            return ssrc, tag
+        cp += optlen
+    return None
 
 
 class RadiodControl:
@@ -690,6 +747,21 @@ class RadiodControl:
     and configure channels.
     """
     
+    # Token-bucket rate limiter state, filled on first use
+    _tokens: Optional[float] = None
+    _last_refill_ns: int = 0
+    
+    # Set by close() to cut short any send_command() retry backoff
+    _shutdown_event: Optional[threading.Event] = None
+    
+    # Per-thread queue of commands held back by batch() until its block exits
+    _batch_local: Optional[threading.local] = None
+    
+    # verify_channel()'s last discovery snapshot and when it was taken
+    _channel_cache: Optional[dict] = None
+    _channel_cache_time: float = 0.0
+    _CHANNEL_CACHE_TTL = 1.0  # seconds
+    
     def __init__(self, status_address: str, max_commands_per_sec: int = 100,
                  interface: Optional[str] = None,
                  client_id: Optional[str] = None):
@@ -723,12 +795,12 @@ class RadiodControl:
         self.socket = None
         self._status_sock = None  # Cached status listener socket for tune()
         self._status_sock_lock = None  # Will be initialized when needed
-        self._socket_lock = threading.RLock()  # Protect control socket operations
+        self._socket_lock = threading.Lock()  # Protect control socket sends
+        self._shutdown_event = threading.Event()
+        self._batch_local = threading.local()
         
         # Rate limiting
         self.max_commands_per_sec = max_commands_per_sec
-        self._command_count = 0
-        self._command_window_start = time.time()
         self._rate_limit_lock = threading.Lock()
         
         # Metrics tracking
@@ -760,22 +832,18 @@ class RadiodControl:
             # Allow multiple sockets to bind to the same port
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             
-            # Set socket options for multicast
-            import struct
-            
             # Determine interface address for multicast operations
             # Use specified interface for multi-homed systems, or INADDR_ANY otherwise
             interface_addr = self.interface if self.interface else '0.0.0.0'
+            interface_bytes = socket.inet_aton(self.interface) if self.interface else _INADDR_ANY
             
             # Set multicast interface for sending
-            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, 
-                                 socket.inet_aton(interface_addr))
+            self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, interface_bytes)
             logger.debug(f"Set IP_MULTICAST_IF to {interface_addr}")
             
             # Join the multicast group on specified interface
-            mreq = struct.pack('=4s4s', 
-                              socket.inet_aton(mcast_addr),  # multicast group address
-                              socket.inet_aton(interface_addr))  # interface to use
+            mreq = _IP_MREQ.pack(socket.inet_aton(mcast_addr),  # multicast group address
+                                 interface_bytes)  # interface to use
             try:
                 self.socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
                 logger.debug(f"Joined multicast group {mcast_addr} on interface {interface_addr}")
@@ -795,6 +863,10 @@ class RadiodControl:
             self.status_mcast_addr = mcast_addr
             self.dest_addr = (mcast_addr, 5006)  # Standard radiod control port
             
+            # Fix the destination once so send_command() can use send()
+            # without passing (and the kernel re-parsing) the address each time
+            self.socket.connect(self.dest_addr)
+            
             logger.info(f"Connected to radiod at {mcast_addr}:5006")
             logger.debug(f"Status multicast: {self.status_mcast_addr}, Control: {self.dest_addr}")
             logger.debug(f"Socket options: REUSEADDR=1, MULTICAST_IF=INADDR_ANY, MULTICAST_LOOP=1, MULTICAST_TTL=2")
@@ -806,35 +878,37 @@ class RadiodControl:
             logger.error(f"Unexpected error connecting to radiod: {e}", exc_info=True)
             raise ConnectionError(f"Failed to connect to radiod: {e}") from e
     
-    def _check_rate_limit(self):
+    def _check_rate_limit(self, count: int = 1):
         """
         Check and enforce rate limiting (thread-safe)
         
-        Implements a sliding window rate limiter to prevent DoS attacks
-        and network flooding.
+        Implements a token bucket holding up to ``max_commands_per_sec``
+        tokens and refilled at that rate, to prevent network flooding.
+        The lock covers only the refill arithmetic; a caller that overdraws
+        the bucket reserves its slot and then sleeps outside the lock.
+        
+        Args:
+            count: Number of commands about to be sent (default: 1)
         """
+        rate = self.max_commands_per_sec
         with self._rate_limit_lock:
-            now = time.time()
-            
-            # Reset window every second
-            if now - self._command_window_start >= 1.0:
-                self._command_count = 0
-                self._command_window_start = now
-            
-            # Check limit
-            if self._command_count >= self.max_commands_per_sec:
-                sleep_time = 1.0 - (now - self._command_window_start)
-                if sleep_time > 0:
-                    logger.warning(
-                        f"Rate limit reached ({self.max_commands_per_sec}/sec), "
-                        f"sleeping {sleep_time:.3f}s"
-                    )
-                    time.sleep(sleep_time)
-                    # Reset after sleeping
-                    self._command_count = 0
-                    self._command_window_start = time.time()
-            
-            self._command_count += 1
+            now = time.monotonic_ns()
+            if self._tokens is None:
+                self._tokens = float(rate)
+            else:
+                elapsed = (now - self._last_refill_ns) * 1e-9
+                self._tokens = min(float(rate), self._tokens + elapsed * rate)
+            self._last_refill_ns = now
+            self._tokens -= count
+            deficit = -self._tokens
+        
+        if deficit > 0:
+            sleep_time = deficit / rate
+            logger.warning(
+                f"Rate limit reached ({rate}/sec), "
+                f"sleeping {sleep_time:.3f}s"
+            )
+            time.sleep(sleep_time)
     
     def send_command(self, cmdbuffer: bytearray, max_retries: int = 3, retry_delay: float = 0.1):
         """
@@ -848,55 +922,172 @@ class RadiodControl:
         
         Raises:
             RuntimeError: If not connected to radiod
-            CommandError: If sending fails after all retries
+            CommandError: If sending fails after all retries, or close() is
+                called while waiting to retry
         """
-        import time
+        local = self._batch_local
+        if local is not None:
+            batch = getattr(local, 'queue', None)
+            if batch is not None:
+                batch.append(bytes(cmdbuffer))
+                return len(cmdbuffer)
         
         with self._socket_lock:
-            if not self.socket:
-                raise RuntimeError("Not connected to radiod")
+            sock = self.socket
+        if not sock:
+            raise RuntimeError("Not connected to radiod")
         
         # Apply rate limiting
         self._check_rate_limit()
+        return self._send_with_retry(sock, cmdbuffer, max_retries, retry_delay)
+    
+    def _send_with_retry(self, sock: socket.socket, cmdbuffer: bytearray,
+                         max_retries: int = 3, retry_delay: float = 0.1):
+        """
+        Send one command packet, retrying socket errors with backoff
         
-        with self._socket_lock:
-            attempt = 0
-            last_error = None
-            for attempt in range(max_retries):
-                try:
-                    # Log hex dump of the command
-                    hex_dump = ' '.join(f'{b:02x}' for b in cmdbuffer)
-                    logger.debug(f"Sending {len(cmdbuffer)} bytes to {self.dest_addr} (attempt {attempt+1}/{max_retries}): {hex_dump}")
-                    
-                    sent = self.socket.sendto(bytes(cmdbuffer), self.dest_addr)
-                    logger.debug(f"Command sent successfully (attempt {attempt + 1})")
+        The caller has already charged the rate limiter for this packet.
+        See send_command() for the arguments and exceptions.
+        """
+        # The lock covers only the send() and the metric updates beside it;
+        # backoff sleeps happen outside it so other senders aren't serialized
+        # behind a retrying one.
+        last_error = None
+        for attempt in range(max_retries):
+            try:
+                debug = logger.isEnabledFor(logging.DEBUG)
+                # Log hex dump of the command (only built when it will be emitted)
+                if debug:
+                    logger.debug("Sending %d bytes to %s (attempt %d/%d): %s",
+                                 len(cmdbuffer), self.dest_addr, attempt + 1, max_retries,
+                                 cmdbuffer.hex(' '))
+                
+                with self._socket_lock:
+                    # Socket is connected to dest_addr; send() takes the
+                    # bytearray directly, no copy needed
+                    sent = sock.send(cmdbuffer)
                     self.metrics.commands_sent += 1
-                    return sent
-                    
-                except socket.error as e:
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        # Exponential backoff
-                        delay = retry_delay * (2 ** attempt)
-                        logger.warning(f"Socket error on attempt {attempt+1}/{max_retries}: {e}. Retrying in {delay:.2f}s...")
+                if debug:
+                    logger.debug("Command sent successfully (attempt %d)", attempt + 1)
+                return sent
+                
+            except socket.error as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    # Exponential backoff
+                    delay = retry_delay * (2 ** attempt)
+                    logger.warning(f"Socket error on attempt {attempt+1}/{max_retries}: {e}. Retrying in {delay:.2f}s...")
+                    shutdown = self._shutdown_event
+                    if shutdown is None:
                         time.sleep(delay)
-                    else:
-                        logger.error(f"Failed to send command after {max_retries} attempts: {last_error}")
+                    elif shutdown.wait(delay):
+                        raise CommandError("Command aborted: control closed during retry") from e
+                else:
+                    logger.error(f"Failed to send command after {max_retries} attempts: {last_error}")
+                    with self._socket_lock:
                         self.metrics.commands_sent += 1
                         self.metrics.commands_failed += 1
                         self.metrics.last_error = str(last_error)
                         self.metrics.last_error_time = time.time()
                         error_type = type(last_error).__name__
                         self.metrics.errors_by_type[error_type] = self.metrics.errors_by_type.get(error_type, 0) + 1
-                        raise CommandError(f"Command failed after {max_retries} attempts") from last_error
-                        
-                except Exception as e:
-                    logger.error(f"Unexpected error sending command: {e}", exc_info=True)
-                    raise CommandError(f"Failed to send command: {e}") from e
-            
-            # Should not reach here, but just in case
-            if last_error:
-                raise CommandError(f"Failed to send command after {max_retries} attempts: {last_error}") from last_error
+                    raise CommandError(f"Command failed after {max_retries} attempts") from last_error
+                    
+            except Exception as e:
+                logger.error(f"Unexpected error sending command: {e}", exc_info=True)
+                raise CommandError(f"Failed to send command: {e}") from e
+        
+        # Should not reach here, but just in case
+        if last_error:
+            raise CommandError(f"Failed to send command after {max_retries} attempts: {last_error}") from last_error
+    
+    @contextmanager
+    def batch(self):
+        """
+        Hold back commands and send them together when the block exits
+        
+        Commands issued inside the block are queued instead of sent, then
+        go out in order on a clean exit: on Linux in one sendmmsg() system
+        call, elsewhere back to back. If the block raises, nothing queued is
+        sent. Nested batch() blocks join the outermost one.
+        
+        The queue belongs to the calling thread; commands other threads
+        send meanwhile go out immediately as usual.
+        
+        Only use this for fire-and-forget setters (set_gain(), set_filter(),
+        ...): tune() and other calls that wait for a status reply would
+        time out, because their command is not sent until the block ends.
+        
+        Example:
+            >>> with control.batch():
+            ...     control.set_preset(ssrc, 'usb')
+            ...     control.set_filter(ssrc, low_edge=100, high_edge=2800)
+            ...     control.set_gain(ssrc, 10.0)
+        """
+        local = self._batch_local
+        if local is None:
+            local = self._batch_local = threading.local()
+        if getattr(local, 'queue', None) is not None:
+            yield self
+            return
+        
+        local.queue = []
+        try:
+            yield self
+        except BaseException:
+            local.queue = None
+            raise
+        queued, local.queue = local.queue, None
+        if queued:
+            self._send_batch(queued)
+    
+    def _send_batch(self, queued: List[bytes]):
+        """
+        Send the commands a batch() block queued
+        
+        One rate-limiter reservation and one socket-lock hold cover the
+        whole batch. Commands left over if the batched send fails part way
+        are re-sent one by one with send_command()'s retries, already paid
+        for by that reservation.
+        """
+        with self._socket_lock:
+            sock = self.socket
+        if not sock:
+            raise RuntimeError("Not connected to radiod")
+        
+        self._check_rate_limit(len(queued))
+        
+        with self._socket_lock:
+            sent = _send_packets(sock, queued)
+            self.metrics.commands_sent += sent
+        logger.debug("Sent %d of %d batched commands", sent, len(queued))
+        
+        for cmdbuffer in queued[sent:]:
+            self._send_with_retry(sock, cmdbuffer)
+    
+    def _send_tlv(self, ssrc: int, *fields):
+        """
+        Build and send a command for one channel
+        
+        Args:
+            ssrc: SSRC of the channel
+            *fields: ``(kind, type_val, value)`` tuples encoded in order, where
+                kind is a key of ``_TLV_ENCODERS`` ('i', 'd', 'f' or 's')
+        
+        The SSRC, a fresh command tag and the EOL marker are appended after
+        the fields.
+        """
+        cmdbuffer = bytearray()
+        cmdbuffer.append(CMD)
+        encoders = _TLV_ENCODERS
+        for kind, type_val, value in fields:
+            encoders[kind](cmdbuffer, type_val, value)
+        encode_int64(cmdbuffer, _T_SSRC, ssrc)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
+        self.send_command(cmdbuffer)
+        if any(type_val in _RETUNE_TYPES for _, type_val, _ in fields):
+            self._forget_cached_channel(ssrc)
     
     def set_frequency(self, ssrc: int, frequency_hz: float):
         """
@@ -909,19 +1100,10 @@ class RadiodControl:
         Raises:
             ValidationError: If parameters are invalid
         """
-        _validate_ssrc(ssrc)
-        _validate_frequency(frequency_hz)
-        
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)  # Command packet type
-        
-        encode_double(cmdbuffer, StatusType.RADIO_FREQUENCY, frequency_hz)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _validate_ssrc_frequency(ssrc, frequency_hz)
         
-        logger.info(f"Setting frequency for SSRC {ssrc} to {frequency_hz/1e6:.3f} MHz")
-        self.send_command(cmdbuffer)
+        logger.info("Setting frequency for SSRC %s to %.3f MHz", ssrc, frequency_hz/1e6)
+        self._send_tlv(ssrc, ('d', StatusType.RADIO_FREQUENCY, frequency_hz))
     
     def set_preset(self, ssrc: int, preset: str):
         """
@@ -937,16 +1119,8 @@ class RadiodControl:
         _validate_ssrc(ssrc)
         _validate_preset(preset)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_string(cmdbuffer, StatusType.PRESET, preset)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting preset for SSRC {ssrc} to {preset}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting preset for SSRC %s to %s", ssrc, preset)
+        self._send_tlv(ssrc, ('s', StatusType.PRESET, preset))
     
     def set_sample_rate(self, ssrc: int, sample_rate: int):
         """
@@ -962,16 +1136,8 @@ class RadiodControl:
         _validate_ssrc(ssrc)
         _validate_sample_rate(sample_rate)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OUTPUT_SAMPRATE, sample_rate)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting sample rate for SSRC {ssrc} to {sample_rate} Hz")
-        self.send_command(cmdbuffer)
+        logger.info("Setting sample rate for SSRC %s to %s Hz", ssrc, sample_rate)
+        self._send_tlv(ssrc, ('i', StatusType.OUTPUT_SAMPRATE, sample_rate))
     
     def set_agc(self, ssrc: int, enable: bool, hangtime: Optional[float] = None, 
                 headroom: Optional[float] = None, recovery_rate: Optional[float] = None,
@@ -1001,10 +1167,10 @@ class RadiodControl:
             encode_float(cmdbuffer, StatusType.AGC_ATTACK_RATE, attack_rate)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting AGC for SSRC {ssrc}: enable={enable}, hangtime={hangtime}, headroom={headroom}")
+        logger.info("Setting AGC for SSRC %s: enable=%s, hangtime=%s, headroom=%s", ssrc, enable, hangtime, headroom)
         self.send_command(cmdbuffer)
     
     def set_gain(self, ssrc: int, gain_db: float):
@@ -1021,16 +1187,8 @@ class RadiodControl:
         _validate_ssrc(ssrc)
         _validate_gain(gain_db)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_double(cmdbuffer, StatusType.GAIN, gain_db)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting gain for SSRC {ssrc} to {gain_db} dB")
-        self.send_command(cmdbuffer)
+        logger.info("Setting gain for SSRC %s to %s dB", ssrc, gain_db)
+        self._send_tlv(ssrc, ('d', StatusType.GAIN, gain_db))
     
     def set_filter(self, ssrc: int, low_edge: Optional[float] = None, 
                    high_edge: Optional[float] = None, kaiser_beta: Optional[float] = None):
@@ -1054,10 +1212,10 @@ class RadiodControl:
             encode_float(cmdbuffer, StatusType.KAISER_BETA, kaiser_beta)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting filter for SSRC {ssrc}: low={low_edge}, high={high_edge}, beta={kaiser_beta}")
+        logger.info("Setting filter for SSRC %s: low=%s, high=%s, beta=%s", ssrc, low_edge, high_edge, kaiser_beta)
         self.send_command(cmdbuffer)
     
     def set_shift_frequency(self, ssrc: int, shift_hz: float):
@@ -1068,16 +1226,8 @@ class RadiodControl:
             ssrc: SSRC of the channel
             shift_hz: Frequency shift in Hz
         """
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_double(cmdbuffer, StatusType.SHIFT_FREQUENCY, shift_hz)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting frequency shift for SSRC {ssrc} to {shift_hz} Hz")
-        self.send_command(cmdbuffer)
+        logger.info("Setting frequency shift for SSRC %s to %s Hz", ssrc, shift_hz)
+        self._send_tlv(ssrc, ('d', StatusType.SHIFT_FREQUENCY, shift_hz))
     
     def set_output_level(self, ssrc: int, level: float):
         """
@@ -1087,16 +1237,8 @@ class RadiodControl:
             ssrc: SSRC of the channel
             level: Output level (range depends on mode)
         """
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_float(cmdbuffer, StatusType.OUTPUT_LEVEL, level)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting output level for SSRC {ssrc} to {level}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting output level for SSRC %s to %s", ssrc, level)
+        self._send_tlv(ssrc, ('f', StatusType.OUTPUT_LEVEL, level))
     
     def create_channel(self, frequency_hz: float,
                        preset: str = "iq", sample_rate: Optional[int] = None,
@@ -1194,22 +1336,19 @@ class RadiodControl:
                 encoding=encoding,
                 radiod_host=self.status_address
             )
-            logger.info(f"Auto-allocated SSRC: {ssrc}")
+            logger.info("Auto-allocated SSRC: %s", ssrc)
         
         # Validate inputs
-        _validate_ssrc(ssrc)
-        _validate_frequency(frequency_hz)
-        if sample_rate is not None:
-            _validate_sample_rate(sample_rate)
-        _validate_gain(gain)
+        _validate_channel_request(ssrc, frequency_hz, sample_rate, gain)
         
-        filter_desc = ""
-        if low_edge is not None or high_edge is not None or kaiser_beta is not None:
-            filter_desc = (f", filter=[{low_edge},{high_edge}]"
-                           f"{f' beta={kaiser_beta}' if kaiser_beta is not None else ''}")
-        logger.info(f"Creating channel: SSRC={ssrc}, freq={frequency_hz/1e6:.3f} MHz, "
-                   f"demod={preset}, rate={sample_rate}Hz, agc={agc_enable}, gain={gain}dB, "
-                   f"enc={encoding}{filter_desc}")
+        if logger.isEnabledFor(logging.INFO):
+            filter_desc = ""
+            if low_edge is not None or high_edge is not None or kaiser_beta is not None:
+                filter_desc = (f", filter=[{low_edge},{high_edge}]"
+                               f"{f' beta={kaiser_beta}' if kaiser_beta is not None else ''}")
+            logger.info("Creating channel: SSRC=%s, freq=%.3f MHz, demod=%s, rate=%sHz, "
+                        "agc=%s, gain=%sdB, enc=%s%s", ssrc, frequency_hz/1e6, preset,
+                        sample_rate, agc_enable, gain, encoding, filter_desc)
         
         # Build a single command packet with ALL parameters
         # This ensures radiod creates the channel with the correct settings
@@ -1220,21 +1359,21 @@ class RadiodControl:
         # This MUST come first - radiod uses it to set up the channel
         _validate_preset(preset)
         encode_string(cmdbuffer, StatusType.PRESET, preset)
-        logger.info(f"Setting preset for SSRC {ssrc} to {preset}")
+        logger.info("Setting preset for SSRC %s to %s", ssrc, preset)
         
         # DEMOD_TYPE: 0=linear (IQ/USB/LSB/etc), 1=FM
         demod_type = 0 if preset.lower() in ['iq', 'usb', 'lsb', 'cw', 'am'] else 1
         encode_int(cmdbuffer, StatusType.DEMOD_TYPE, demod_type)
-        logger.info(f"Setting DEMOD_TYPE for SSRC {ssrc} to {demod_type}")
+        logger.info("Setting DEMOD_TYPE for SSRC %s to %s", ssrc, demod_type)
         
         # Frequency
         encode_double(cmdbuffer, StatusType.RADIO_FREQUENCY, frequency_hz)
-        logger.info(f"Setting frequency for SSRC {ssrc} to {frequency_hz/1e6:.3f} MHz")
+        logger.info("Setting frequency for SSRC %s to %.3f MHz", ssrc, frequency_hz/1e6)
         
         # Sample rate
         if sample_rate:
             encode_int(cmdbuffer, StatusType.OUTPUT_SAMPRATE, sample_rate)
-            logger.info(f"Setting sample rate for SSRC {ssrc} to {sample_rate} Hz")
+            logger.info("Setting sample rate for SSRC %s to %s Hz", ssrc, sample_rate)
 
         # Filter edges + Kaiser beta — override the preset defaults inline
         # with the create command so the channel goes live with the requested
@@ -1242,21 +1381,21 @@ class RadiodControl:
         # as set_filter().
         if low_edge is not None:
             encode_double(cmdbuffer, StatusType.LOW_EDGE, low_edge)
-            logger.info(f"Setting LOW_EDGE for SSRC {ssrc} to {low_edge} Hz")
+            logger.info("Setting LOW_EDGE for SSRC %s to %s Hz", ssrc, low_edge)
         if high_edge is not None:
             encode_double(cmdbuffer, StatusType.HIGH_EDGE, high_edge)
-            logger.info(f"Setting HIGH_EDGE for SSRC {ssrc} to {high_edge} Hz")
+            logger.info("Setting HIGH_EDGE for SSRC %s to %s Hz", ssrc, high_edge)
         if kaiser_beta is not None:
             encode_float(cmdbuffer, StatusType.KAISER_BETA, kaiser_beta)
-            logger.info(f"Setting KAISER_BETA for SSRC {ssrc} to {kaiser_beta}")
+            logger.info("Setting KAISER_BETA for SSRC %s to %s", ssrc, kaiser_beta)
 
         # AGC setting
         encode_int(cmdbuffer, StatusType.AGC_ENABLE, agc_enable)
-        logger.info(f"Setting AGC_ENABLE for SSRC {ssrc} to {agc_enable}")
+        logger.info("Setting AGC_ENABLE for SSRC %s to %s", ssrc, agc_enable)
         
         # Gain setting
         encode_double(cmdbuffer, StatusType.GAIN, gain)
-        logger.info(f"Setting GAIN for SSRC {ssrc} to {gain} dB")
+        logger.info("Setting GAIN for SSRC %s to %s dB", ssrc, gain)
         
         # Encoding setting - NOT sending in main buffer anymore
         # Radiod requires OUTPUT_ENCODING to be sent in a separate command after creation
@@ -1280,15 +1419,15 @@ class RadiodControl:
                     raise ValidationError(f"Invalid port in destination '{destination}'")
             
             encode_socket(cmdbuffer, StatusType.OUTPUT_DATA_DEST_SOCKET, dest_addr, dest_port)
-            logger.info(f"Setting destination for SSRC {ssrc} to {dest_addr}:{dest_port}")
+            logger.info("Setting destination for SSRC %s to %s:%s", ssrc, dest_addr, dest_port)
         
         # SSRC and command tag
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
+        _encode_tag(cmdbuffer, next_command_tag())
         if lifetime is not None:
             encode_int(cmdbuffer, StatusType.LIFETIME, int(lifetime))
-            logger.info(f"Setting LIFETIME for SSRC {ssrc} to {lifetime} frames")
-        encode_eol(cmdbuffer)
+            logger.info("Setting LIFETIME for SSRC %s to %s frames", ssrc, lifetime)
+        cmdbuffer += _EOL
 
         # Send the main creation packet
         self.send_command(cmdbuffer)
@@ -1300,16 +1439,17 @@ class RadiodControl:
             
             # Target the SSRC we just created
             encode_int(encbuffer, StatusType.OUTPUT_SSRC, ssrc)
-            encode_int(encbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
+            _encode_tag(encbuffer, next_command_tag())
             
             # Set the encoding
             encode_int(encbuffer, StatusType.OUTPUT_ENCODING, encoding)
-            encode_eol(encbuffer)
+            encbuffer += _EOL
             
             self.send_command(encbuffer)
-            logger.info(f"Sent separate OUTPUT_ENCODING command for SSRC {ssrc}: {encoding}")
+            logger.info("Sent separate OUTPUT_ENCODING command for SSRC %s: %s", ssrc, encoding)
         
-        logger.info(f"Channel {ssrc} created and configured")
+        self._forget_cached_channel(ssrc)
+        logger.info("Channel %s created and configured", ssrc)
         return ssrc
     
     def verify_channel(self, ssrc: int, expected_freq: Optional[float] = None) -> bool:
@@ -1322,9 +1462,27 @@ class RadiodControl:
         
         Returns:
             True if channel exists and matches expectations
-        """
+        
+        Note:
+            Discovery results are reused for up to a second, so verifying
+            a batch of channels costs one discovery rather than one per
+            channel. Only a successful check is taken from the snapshot;
+            a missing or mismatched channel is always re-discovered
+            before False is returned. Creating, removing or retuning a
+            channel (frequency or preset) through this instance drops it
+            from the snapshot.
+        """
+        channels = self._channel_cache
+        if channels is not None and time.monotonic() - self._channel_cache_time <= self._CHANNEL_CACHE_TTL:
+            channel = channels.get(ssrc)
+            if channel is not None and not (expected_freq and abs(channel.frequency - expected_freq) > 1):
+                logger.info("Channel %s verified: %.3f MHz, %s", ssrc, channel.frequency/1e6, channel.preset)
+                return True
+        
         # Discover current channels
         channels = discover_channels(self.status_address)
+        self._channel_cache = channels
+        self._channel_cache_time = time.monotonic()
         
         if ssrc not in channels:
             logger.warning(f"Channel {ssrc} not found")
@@ -1340,9 +1498,14 @@ class RadiodControl:
             )
             return False
         
-        logger.info(f"Channel {ssrc} verified: {channel.frequency/1e6:.3f} MHz, {channel.preset}")
+        logger.info("Channel %s verified: %.3f MHz, %s", ssrc, channel.frequency/1e6, channel.preset)
         return True
     
+    def _forget_cached_channel(self, ssrc: int):
+        """Drop one channel from verify_channel()'s discovery snapshot"""
+        if self._channel_cache is not None:
+            self._channel_cache.pop(ssrc, None)
+    
     def ensure_channel(
         self,
         frequency_hz: float,
@@ -1443,7 +1606,6 @@ class RadiodControl:
             applications requesting the same parameters will share the same
             channel, reducing radiod resource usage.
         """
-        from .addressing import generate_multicast_ip
         from .discovery import ChannelInfo, discover_channels
 
         # Validate inputs
@@ -1480,7 +1642,7 @@ class RadiodControl:
             encoding=encoding,
             radiod_host=self.status_address
         )
-        logger.info(f"ensure_channel: computed SSRC {ssrc} for {frequency_hz/1e6:.3f} MHz {preset} dest={destination} enc={encoding} radiod={self.status_address}")
+        logger.info("ensure_channel: computed SSRC %s for %.3f MHz %s dest=%s enc=%s radiod=%s", ssrc, frequency_hz/1e6, preset, destination, encoding, self.status_address)
         
         # Check if channel already exists with matching parameters
         existing_channels = discover_channels(self.status_address, listen_duration=1.0)
@@ -1551,7 +1713,7 @@ class RadiodControl:
                 )
         
         # Create or reconfigure the channel
-        logger.info(f"ensure_channel: creating/configuring channel SSRC {ssrc}")
+        logger.info("ensure_channel: creating/configuring channel SSRC %s", ssrc)
         self.create_channel(
             frequency_hz=frequency_hz,
             preset=preset,
@@ -1612,7 +1774,7 @@ class RadiodControl:
                         issues.append(f"preset={channel.preset} (want {preset})")
                     if not dest_ok:
                         issues.append(f"dest={channel.multicast_address} (want {destination})")
-                    logger.debug(f"ensure_channel: channel mismatch: {', '.join(issues)}")
+                    logger.debug("ensure_channel: channel mismatch: %s", ', '.join(issues))
             
             # Increase interval with backoff (cap at 1s)
             verify_interval = min(verify_interval * 1.5, 1.0)
@@ -1660,11 +1822,12 @@ class RadiodControl:
         # Setting frequency to 0 removes the channel in radiod
         encode_double(cmdbuffer, StatusType.RADIO_FREQUENCY, 0.0)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
         logger.info(f"Removing channel SSRC {ssrc}")
         self.send_command(cmdbuffer)
+        self._forget_cached_channel(ssrc)
 
     def set_channel_lifetime(self, ssrc: int, lifetime: int):
         """
@@ -1703,11 +1866,11 @@ class RadiodControl:
         cmdbuffer = bytearray()
         cmdbuffer.append(CMD)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
+        _encode_tag(cmdbuffer, next_command_tag())
         encode_int(cmdbuffer, StatusType.LIFETIME, lifetime)
-        encode_eol(cmdbuffer)
+        cmdbuffer += _EOL
 
-        logger.info(f"Setting LIFETIME for SSRC {ssrc} to {lifetime} frames")
+        logger.info("Setting LIFETIME for SSRC %s to %s frames", ssrc, lifetime)
         self.send_command(cmdbuffer)
 
     def set_squelch(self, ssrc: int, open_threshold: Optional[float] = None,
@@ -1732,10 +1895,10 @@ class RadiodControl:
             encode_int(cmdbuffer, StatusType.SNR_SQUELCH, 1 if snr_squelch else 0)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting squelch for SSRC {ssrc}")
+        logger.info("Setting squelch for SSRC %s", ssrc)
         self.send_command(cmdbuffer)
 
     def set_pll(self, ssrc: int, enable: Optional[bool] = None, 
@@ -1760,10 +1923,10 @@ class RadiodControl:
             encode_int(cmdbuffer, StatusType.PLL_SQUARE, 1 if square else 0)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting PLL for SSRC {ssrc}")
+        logger.info("Setting PLL for SSRC %s", ssrc)
         self.send_command(cmdbuffer)
 
     def set_output_channels(self, ssrc: int, channels: int):
@@ -1774,16 +1937,8 @@ class RadiodControl:
             ssrc: SSRC of the channel
             channels: Number of channels (1=mono, 2=stereo)
         """
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OUTPUT_CHANNELS, channels)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting output channels for SSRC {ssrc} to {channels}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting output channels for SSRC %s to %s", ssrc, channels)
+        self._send_tlv(ssrc, ('i', StatusType.OUTPUT_CHANNELS, channels))
 
     def set_independent_sideband(self, ssrc: int, enable: bool):
         """
@@ -1793,16 +1948,8 @@ class RadiodControl:
             ssrc: SSRC of the channel
             enable: Enable ISB mode
         """
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.INDEPENDENT_SIDEBAND, 1 if enable else 0)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting ISB for SSRC {ssrc} to {enable}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting ISB for SSRC %s to %s", ssrc, enable)
+        self._send_tlv(ssrc, ('i', StatusType.INDEPENDENT_SIDEBAND, 1 if enable else 0))
 
     def set_envelope_detection(self, ssrc: int, enable: bool):
         """
@@ -1812,16 +1959,8 @@ class RadiodControl:
             ssrc: SSRC of the channel
             enable: Enable envelope detection
         """
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.ENVELOPE, 1 if enable else 0)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting envelope detection for SSRC {ssrc} to {enable}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting envelope detection for SSRC %s to %s", ssrc, enable)
+        self._send_tlv(ssrc, ('i', StatusType.ENVELOPE, 1 if enable else 0))
 
     def set_opus_bitrate(self, ssrc: int, bitrate: int):
         """
@@ -1831,21 +1970,14 @@ class RadiodControl:
             ssrc: SSRC of the channel
             bitrate: Bitrate in bits per second (6000-510000)
         """
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OPUS_BITRATE, bitrate)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting Opus bitrate for SSRC {ssrc} to {bitrate}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting Opus bitrate for SSRC %s to %s", ssrc, bitrate)
+        self._send_tlv(ssrc, ('i', StatusType.OPUS_BITRATE, bitrate))
     
     def _setup_status_listener(self):
         """Set up socket to listen for status responses"""
-        # Create a separate socket for receiving status messages
-        status_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Create a separate socket for receiving status messages, already
+        # non-blocking where the platform allows it
+        status_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM | _SOCK_NONBLOCK)
         status_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         
         # Set SO_REUSEPORT to allow multiple processes to bind (if available)
@@ -1862,7 +1994,7 @@ class RadiodControl:
         try:
             status_sock.bind(('0.0.0.0', 5006))  # Bind to radiod status port on all interfaces
             bound_port = status_sock.getsockname()[1]
-            logger.debug(f"Bound to port {bound_port} for multicast reception")
+            logger.debug("Bound to port %s for multicast reception", bound_port)
         except OSError as e:
             logger.error(f"Failed to bind socket: {e}")
             raise
@@ -1870,14 +2002,15 @@ class RadiodControl:
         # Join the multicast group on specified interface
         # Use the status multicast address (where status packets are sent)
         interface_addr = self.interface if self.interface else '0.0.0.0'
-        mreq = struct.pack('=4s4s', 
-                          socket.inet_aton(self.status_mcast_addr),  # status multicast group
-                          socket.inet_aton(interface_addr))  # interface to use
+        mreq = _IP_MREQ.pack(socket.inet_aton(self.status_mcast_addr),  # status multicast group
+                             socket.inet_aton(self.interface) if self.interface else _INADDR_ANY)
         status_sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-        logger.debug(f"Joined status multicast group {self.status_mcast_addr} on interface {interface_addr}")
+        logger.debug("Joined status multicast group %s on interface %s", self.status_mcast_addr, interface_addr)
         
-        # Set timeout for polling
-        status_sock.settimeout(0.1)  # 100ms timeout
+        # Non-blocking: every reader waits in select() first, and tune()
+        # drains queued packets until recvfrom() raises BlockingIOError
+        if not _SOCK_NONBLOCK:
+            status_sock.setblocking(False)
         
         return status_sock
     
@@ -1892,8 +2025,6 @@ class RadiodControl:
         Returns:
             Cached or newly created status listener socket
         """
-        import threading
-        
         # Lazy initialization of lock (avoid threading overhead if never used)
         if self._status_sock_lock is None:
             self._status_sock_lock = threading.Lock()
@@ -1906,58 +2037,29 @@ class RadiodControl:
                 logger.debug("Reusing cached status listener socket")
             return self._status_sock
     
-    def tune(self, ssrc: int, frequency_hz: Optional[float] = None,
-             preset: Optional[str] = None, sample_rate: Optional[int] = None,
-             low_edge: Optional[float] = None, high_edge: Optional[float] = None,
-             gain: Optional[float] = None, agc_enable: Optional[bool] = None,
-             rf_gain: Optional[float] = None, rf_atten: Optional[float] = None,
-             encoding: Optional[int] = None, destination: Optional[str] = None,
-             lifetime: Optional[int] = None,
-             timeout: float = 5.0) -> dict:
+    def _build_tune_command(self, ssrc: int, command_tag: int,
+                            frequency_hz: Optional[float] = None,
+                            preset: Optional[str] = None,
+                            sample_rate: Optional[int] = None,
+                            low_edge: Optional[float] = None,
+                            high_edge: Optional[float] = None,
+                            gain: Optional[float] = None,
+                            agc_enable: Optional[bool] = None,
+                            rf_gain: Optional[float] = None,
+                            rf_atten: Optional[float] = None,
+                            encoding: Optional[int] = None,
+                            destination: Optional[str] = None,
+                            lifetime: Optional[int] = None) -> bytearray:
         """
-        Tune a channel and retrieve its status (like tune.c in ka9q-radio)
+        Validate tune() parameters and build the command packet
         
-        This method sends tuning commands to radiod and waits for a status response,
-        replicating the functionality of the tune utility in ka9q-radio.
+        Shared by tune() and tune_many(). See tune() for parameter details.
         
-        Args:
-            ssrc: SSRC of the channel to tune
-            frequency_hz: Frequency in Hz (optional)
-            preset: Preset/mode name (optional, e.g., "iq", "usb", "lsb")
-            sample_rate: Sample rate in Hz (optional)
-            low_edge: Low filter edge in Hz (optional)
-            high_edge: High filter edge in Hz (optional)
-            gain: Manual gain in dB (optional, disables AGC)
-            agc_enable: Enable AGC (optional)
-            rf_gain: RF front-end gain in dB (optional)
-            rf_atten: RF front-end attenuation in dB (optional)
-            encoding: Output encoding type (optional, use Encoding constants)
-            destination: Destination multicast address (optional)
-            lifetime: Set/refresh the channel auto-destruct timer, in radiod
-                     frames. See ``set_channel_lifetime``. None = don't touch.
-            timeout: Maximum time to wait for response in seconds (default: 5.0)
-            
         Returns:
-            Dictionary containing channel status with keys:
-            - ssrc: Channel SSRC
-            - frequency: Radio frequency in Hz
-            - preset: Mode/preset name
-            - sample_rate: Sample rate in Hz
-            - agc_enable: AGC enabled status
-            - gain: Current gain in dB
-            - rf_gain: RF gain in dB
-            - rf_atten: RF attenuation in dB
-            - rf_agc: RF AGC status
-            - low_edge: Low filter edge in Hz
-            - high_edge: High filter edge in Hz
-            - noise_density: Noise density in dB/Hz
-            - baseband_power: Baseband power in dB
-            - encoding: Output encoding type
-            - destination: Destination socket address
-            - snr: Signal-to-noise ratio in dB (calculated)
-        
+            Encoded command packet carrying ``command_tag``
+            
         Raises:
-            TimeoutError: If no matching response received within timeout
+            ValidationError: If any parameter is invalid
         """
         # Validate inputs
         _validate_ssrc(ssrc)
@@ -1967,18 +2069,12 @@ class RadiodControl:
             _validate_sample_rate(sample_rate)
         if gain is not None:
             _validate_gain(gain)
-        _validate_timeout(timeout)
-        
-        import time
-        import select
         
         # Build command packet with all specified parameters
         cmdbuffer = bytearray()
         cmdbuffer.append(CMD)
         
-        # Generate command tag for matching response
-        command_tag = secrets.randbits(31)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, command_tag)
+        _encode_tag(cmdbuffer, command_tag)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
         
         if preset is not None:
@@ -2029,7 +2125,7 @@ class RadiodControl:
                     raise ValidationError(f"Invalid port in destination '{destination}'")
             
             encode_socket(cmdbuffer, StatusType.OUTPUT_DATA_DEST_SOCKET, dest_addr, dest_port)
-            logger.info(f"Setting destination for SSRC {ssrc} to {dest_addr}:{dest_port}")
+            logger.info("Setting destination for SSRC %s to %s:%s", ssrc, dest_addr, dest_port)
 
         if lifetime is not None:
             if not isinstance(lifetime, int) or lifetime < 0:
@@ -2037,191 +2133,273 @@ class RadiodControl:
                     f"lifetime must be a non-negative int (frames); got {lifetime!r}"
                 )
             encode_int(cmdbuffer, StatusType.LIFETIME, lifetime)
-            logger.info(f"Setting LIFETIME for SSRC {ssrc} to {lifetime} frames")
+            logger.info("Setting LIFETIME for SSRC %s to %s frames", ssrc, lifetime)
 
-        encode_eol(cmdbuffer)
+        cmdbuffer += _EOL
+        return cmdbuffer
+    
+    def tune(self, ssrc: int, frequency_hz: Optional[float] = None,
+             preset: Optional[str] = None, sample_rate: Optional[int] = None,
+             low_edge: Optional[float] = None, high_edge: Optional[float] = None,
+             gain: Optional[float] = None, agc_enable: Optional[bool] = None,
+             rf_gain: Optional[float] = None, rf_atten: Optional[float] = None,
+             encoding: Optional[int] = None, destination: Optional[str] = None,
+             lifetime: Optional[int] = None,
+             timeout: float = 5.0) -> dict:
+        """
+        Tune a channel and retrieve its status (like tune.c in ka9q-radio)
         
-        # Get cached status listener (or create if first use)
-        # Socket is reused across tune() calls to avoid creation/destruction overhead
-        status_sock = self._get_or_create_status_listener()
+        This method sends tuning commands to radiod and waits for a status response,
+        replicating the functionality of the tune utility in ka9q-radio.
         
-        try:
-            start_time = time.time()
-            last_send_time = 0
-            retry_interval = 0.1  # Start at 100ms
-            max_retry_interval = 1.0  # Cap at 1 second
-            attempts = 0
-            
-            while time.time() - start_time < timeout:
-                # Send command with exponential backoff
-                current_time = time.time()
-                if current_time - last_send_time >= retry_interval:
-                    self.send_command(cmdbuffer)
-                    last_send_time = current_time
-                    attempts += 1
-                    logger.debug(f"Sent tune command with tag {command_tag} (attempt {attempts})")
-                    
-                    # Exponential backoff: 100ms, 200ms, 400ms, 800ms, 1000ms (capped)
-                    # This reduces network spam and CPU usage significantly
-                    retry_interval = min(retry_interval * 2, max_retry_interval)
-                
-                # Check for incoming status messages with adaptive timeout
-                try:
-                    # Use remaining time or retry interval, whichever is smaller
-                    remaining = timeout - (time.time() - start_time)
-                    select_timeout = min(retry_interval, remaining, 0.5)
-                    
-                    ready = select.select([status_sock], [], [], select_timeout)
-                    if not ready[0]:
-                        logger.debug(f"select() timed out after {select_timeout:.3f}s, no packets received")
-                        continue
-                    
-                    response_buffer, addr = status_sock.recvfrom(8192)
-                    logger.debug(f"Received {len(response_buffer)} bytes from {addr}")
-                    logger.debug(f"First 16 bytes: {' '.join(f'{b:02x}' for b in response_buffer[:16])}")
-                    
-                    # Parse response
-                    if len(response_buffer) == 0 or response_buffer[0] != 0:
-                        continue  # Not a status response
-                    
-                    # Decode the response
-                    status = self._decode_status_response(response_buffer)
-                    
-                    # Check if this response is for our command
-                    if status.get('ssrc') == ssrc and status.get('command_tag') == command_tag:
-                        logger.info(f"Received matching status response for SSRC {ssrc}")
-                        return status
-                    else:
-                        logger.debug(f"Response not for us: ssrc={status.get('ssrc')}, tag={status.get('command_tag')}")
-                
-                except socket.timeout:
-                    continue
+        Args:
+            ssrc: SSRC of the channel to tune
+            frequency_hz: Frequency in Hz (optional)
+            preset: Preset/mode name (optional, e.g., "iq", "usb", "lsb")
+            sample_rate: Sample rate in Hz (optional)
+            low_edge: Low filter edge in Hz (optional)
+            high_edge: High filter edge in Hz (optional)
+            gain: Manual gain in dB (optional, disables AGC)
+            agc_enable: Enable AGC (optional)
+            rf_gain: RF front-end gain in dB (optional)
+            rf_atten: RF front-end attenuation in dB (optional)
+            encoding: Output encoding type (optional, use Encoding constants)
+            destination: Destination multicast address (optional)
+            lifetime: Set/refresh the channel auto-destruct timer, in radiod
+                     frames. See ``set_channel_lifetime``. None = don't touch.
+            timeout: Maximum time to wait for response in seconds (default: 5.0)
             
+        Returns:
+            Dictionary containing channel status with keys:
+            - ssrc: Channel SSRC
+            - frequency: Radio frequency in Hz
+            - preset: Mode/preset name
+            - sample_rate: Sample rate in Hz
+            - agc_enable: AGC enabled status
+            - gain: Current gain in dB
+            - rf_gain: RF gain in dB
+            - rf_atten: RF attenuation in dB
+            - rf_agc: RF AGC status
+            - low_edge: Low filter edge in Hz
+            - high_edge: High filter edge in Hz
+            - noise_density: Noise density in dB/Hz
+            - baseband_power: Baseband power in dB
+            - encoding: Output encoding type
+            - destination: Destination socket address
+            - snr: Signal-to-noise ratio in dB (calculated)
+        
+        Raises:
+            TimeoutError: If no matching response received within timeout
+        """
+        _validate_timeout(timeout)
+        
+        # Generate command tag for matching response
+        command_tag = next_command_tag()
+        cmdbuffer = self._build_tune_command(
+            ssrc, command_tag,
+            frequency_hz=frequency_hz, preset=preset, sample_rate=sample_rate,
+            low_edge=low_edge, high_edge=high_edge, gain=gain,
+            agc_enable=agc_enable, rf_gain=rf_gain, rf_atten=rf_atten,
+            encoding=encoding, destination=destination, lifetime=lifetime,
+        )
+        if frequency_hz is not None or preset is not None:
+            self._forget_cached_channel(ssrc)
+        
+        results = self._await_status({(ssrc, command_tag): cmdbuffer}, timeout)
+        if ssrc not in results:
             raise TimeoutError(f"No status response received for SSRC {ssrc} within {timeout}s")
         
-        finally:
-            # NOTE: Do NOT close status_sock here - it's cached for reuse
-            # Socket will be closed in close() method
-            pass
+        logger.info("Received matching status response for SSRC %s", ssrc)
+        return results[ssrc]
     
-    def _decode_status_response(self, buffer: bytes) -> dict:
+    def tune_many(self, requests: List[dict], timeout: float = 5.0) -> Dict[int, dict]:
         """
-        Decode a status response packet from radiod
+        Tune several channels at once and collect their status responses
+        
+        Calling tune() in a loop waits out each channel's round trip (and
+        retry backoff) in turn. tune_many() instead sends every command up
+        front, then matches incoming status packets to the outstanding
+        requests by (ssrc, command_tag) in a single receive loop, so the
+        total wait is roughly that of the slowest channel. Unanswered
+        commands are re-sent together with the same exponential backoff
+        tune() uses.
         
         Args:
-            buffer: Raw response bytes
+            requests: List of dicts of tune() keyword arguments. Each must
+                     contain ``ssrc``; SSRCs must be unique within the batch.
+                     ``timeout`` applies to the whole batch and may not be
+                     given per request.
+            timeout: Maximum time to wait for all responses in seconds (default: 5.0)
             
         Returns:
-            Dictionary containing decoded status fields
+            Dictionary mapping SSRC to the status dictionary tune() would
+            have returned for it. SSRCs that did not answer within
+            ``timeout`` are absent from the result.
+            
+        Raises:
+            ValidationError: If a request is missing ``ssrc``, repeats an
+                            SSRC, or carries invalid tune() parameters
+            
+        Example:
+            >>> statuses = control.tune_many([
+            ...     {'ssrc': 1001, 'frequency_hz': 7.074e6, 'preset': 'usb'},
+            ...     {'ssrc': 1002, 'frequency_hz': 14.074e6, 'preset': 'usb'},
+            ... ])
+            >>> for ssrc, status in statuses.items():
+            ...     print(ssrc, status['frequency'])
         """
-        status = {}
+        _validate_timeout(timeout)
         
-        if len(buffer) == 0 or buffer[0] != 0:
-            return status  # Not a status response
+        # Build every command before sending anything so a bad request
+        # fails the whole batch without side effects
+        pending = {}  # (ssrc, command_tag) -> command packet
+        seen_ssrcs = set()
+        retuned = []  # SSRCs whose frequency or preset the batch changes
+        for request in requests:
+            params = dict(request)
+            if 'ssrc' not in params:
+                raise ValidationError(f"tune_many request missing 'ssrc': {request!r}")
+            if 'timeout' in params:
+                raise ValidationError("tune_many requests may not set 'timeout'; pass it to tune_many()")
+            ssrc = params.pop('ssrc')
+            unknown = sorted(set(params) - _TUNE_PARAMS)
+            if unknown:
+                raise ValidationError(
+                    f"tune_many request for SSRC {ssrc} has unknown parameter(s): "
+                    f"{', '.join(unknown)}"
+                )
+            if ssrc in seen_ssrcs:
+                raise ValidationError(f"Duplicate SSRC {ssrc} in tune_many requests")
+            seen_ssrcs.add(ssrc)
+            
+            command_tag = next_command_tag()
+            pending[(ssrc, command_tag)] = self._build_tune_command(ssrc, command_tag, **params)
+            if params.get('frequency_hz') is not None or params.get('preset') is not None:
+                retuned.append(ssrc)
         
-        cp = 1  # Skip packet type byte
+        for ssrc in retuned:
+            self._forget_cached_channel(ssrc)
         
-        while cp < len(buffer):
-            if cp >= len(buffer):
-                break
-            
-            type_val = buffer[cp]
-            cp += 1
-            
-            if type_val == StatusType.EOL:
-                break
-            
-            if cp >= len(buffer):
-                break
-            
-            optlen = buffer[cp]
-            cp += 1
+        if not pending:
+            return {}
+        
+        results = self._await_status(pending, timeout)
+        
+        if pending:
+            missing = sorted(ssrc for ssrc, _ in pending)
+            logger.warning("tune_many: no status response within %ss for SSRC(s) %s", timeout, missing)
+        
+        return results
+    
+    def _await_status(self, pending: dict, timeout: float) -> Dict[int, dict]:
+        """
+        Send commands and collect the status packets that answer them
+        
+        The receive loop shared by tune() and tune_many(). Commands still
+        unanswered are re-sent with exponential backoff (100 ms doubling to
+        a 1 s cap) until ``timeout`` runs out on the monotonic clock.
+        select() sleeps until a packet arrives or the next retry or the
+        deadline is due. Each wakeup drains every queued packet, and packets
+        answering nothing in ``pending`` are rejected by _peek_ssrc_tag()
+        before any full decode.
+        
+        Args:
+            pending: ``{(ssrc, command_tag): command packet}``; answered
+                     entries are removed from it
+            timeout: Maximum time to wait in seconds
+        
+        Returns:
+            Dictionary mapping SSRC to decoded status for every command
+            answered before the deadline
+        """
+        # Socket is cached and reused across calls; close() closes it
+        status_sock = self._get_or_create_status_listener()
+        
+        # Bind what the loop calls to locals once, rather than looking
+        # them up on self / the modules on every pass
+        clock = time.monotonic
+        wait = select.select
+        send = self.send_command
+        recv = status_sock.recvfrom_into
+        peek = _peek_ssrc_tag
+        decode = decode_status_tlv
+        metrics = self.metrics
+        rlist = [status_sock]
+        
+        # One receive buffer per call, reused for every packet; decoded
+        # status values are copies, so nothing returned aliases it
+        rxbuf = bytearray(8192)
+        rxview = memoryview(rxbuf)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        results = {}
+        now = clock()
+        deadline = now + timeout
+        next_retry_at = now  # First send goes out immediately
+        retry_interval = 0.1  # Start at 100ms
+        max_retry_interval = 1.0  # Cap at 1 second
+        attempts = 0
+        
+        while pending and now < deadline:
+            if now >= next_retry_at:
+                for cmdbuffer in pending.values():
+                    send(cmdbuffer)
+                attempts += 1
+                if debug:
+                    logger.debug("Sent %d command(s) awaiting status (attempt %d)", len(pending), attempts)
+                
+                # Exponential backoff: 200ms, 400ms, 800ms, 1000ms (capped)
+                retry_interval = min(retry_interval * 2, max_retry_interval)
+                next_retry_at = now + retry_interval
             
-            # Handle extended length encoding
-            if optlen & 0x80:
-                length_of_length = optlen & 0x7f
-                optlen = 0
-                for _ in range(length_of_length):
-                    if cp >= len(buffer):
+            try:
+                ready = wait(rlist, [], [], min(next_retry_at, deadline) - now)
+                # Drain everything already queued before going back to
+                # select(); the non-blocking socket raises BlockingIOError
+                # once the queue is empty
+                while ready[0]:
+                    nbytes, addr = recv(rxbuf)
+                    response_buffer = rxview[:nbytes]
+                    if debug:
+                        logger.debug("Received %d bytes from %s: %s", nbytes, addr,
+                                     response_buffer[:16].hex(' '))
+                    
+                    # Only status packets can answer a command
+                    if nbytes == 0 or response_buffer[0] != 0:
+                        continue
+                    metrics.status_received += 1
+                    
+                    key = peek(response_buffer)
+                    if key not in pending:
+                        continue
+                    del pending[key]
+                    results[key[0]] = decode(response_buffer)
+                    if debug:
+                        logger.debug("Received status for SSRC %s tag %s", key[0], key[1])
+                    if not pending:
                         break
-                    optlen = (optlen << 8) | buffer[cp]
-                    cp += 1
             
-            if cp + optlen > len(buffer):
-                break
+            except (BlockingIOError, socket.timeout):
+                pass
             
-            data = buffer[cp:cp + optlen]
-            
-            # Decode based on type
-            if type_val == StatusType.COMMAND_TAG:
-                status['command_tag'] = decode_int32(data, optlen)
-            elif type_val == StatusType.GPS_TIME:
-                status['gps_time'] = decode_int64(data, optlen)
-            elif type_val == StatusType.RTP_TIMESNAP:
-                status['rtp_timesnap'] = decode_int32(data, optlen)
-            elif type_val == StatusType.RADIO_FREQUENCY:
-                status['frequency'] = decode_double(data, optlen)
-            elif type_val == StatusType.OUTPUT_SSRC:
-                status['ssrc'] = decode_int32(data, optlen)
-            elif type_val == StatusType.AGC_ENABLE:
-                status['agc_enable'] = decode_bool(data, optlen)
-            elif type_val == StatusType.GAIN:
-                status['gain'] = decode_float(data, optlen)
-            elif type_val == StatusType.RF_GAIN:
-                status['rf_gain'] = decode_float(data, optlen)
-            elif type_val == StatusType.RF_ATTEN:
-                status['rf_atten'] = decode_float(data, optlen)
-            elif type_val == StatusType.RF_AGC:
-                status['rf_agc'] = decode_int(data, optlen)
-            elif type_val == StatusType.PRESET:
-                status['preset'] = decode_string(data, optlen)
-            elif type_val == StatusType.LOW_EDGE:
-                status['low_edge'] = decode_float(data, optlen)
-            elif type_val == StatusType.HIGH_EDGE:
-                status['high_edge'] = decode_float(data, optlen)
-            elif type_val == StatusType.NOISE_DENSITY:
-                status['noise_density'] = decode_float(data, optlen)
-            elif type_val == StatusType.BASEBAND_POWER:
-                status['baseband_power'] = decode_float(data, optlen)
-            elif type_val == StatusType.OUTPUT_SAMPRATE:
-                status['sample_rate'] = decode_int(data, optlen)
-            elif type_val == StatusType.OUTPUT_ENCODING:
-                status['encoding'] = decode_int(data, optlen)
-            elif type_val == StatusType.OUTPUT_DATA_DEST_SOCKET:
-                status['destination'] = decode_socket(data, optlen)
-            elif type_val == StatusType.OUTPUT_TTL:
-                status['ttl'] = decode_int(data, optlen)
-                if status['ttl'] == 0:
-                    logger.warning(f"Radiod reporting TTL=0 for SSRC {status.get('ssrc', 'unknown')}: Multicast data restricted to localhost loopback only!")
-            elif type_val == StatusType.LIFETIME:
-                status['lifetime'] = decode_int(data, optlen)
-            elif type_val == StatusType.DESCRIPTION:
-                status['description'] = decode_string(data, optlen)
-
-            cp += optlen
+            now = clock()
+        
+        return results
+    
+    def _decode_status_response(self, buffer: bytes) -> dict:
+        """
+        Decode a status response packet from radiod
+        
+        Thin wrapper around :func:`decode_status_tlv` that also counts the
+        packet in :attr:`metrics`.
         
-        # Calculate SNR if we have the necessary data
-        if all(k in status for k in ['baseband_power', 'low_edge', 'high_edge', 'noise_density']):
-            import math
-            bandwidth = abs(status['high_edge'] - status['low_edge'])
+        Args:
+            buffer: Raw response bytes
             
-            # Guard against invalid bandwidth
-            if bandwidth > 0:
-                try:
-                    noise_power_db = status['noise_density'] + 10 * math.log10(bandwidth)
-                    signal_plus_noise_db = status['baseband_power']
-                    # Convert to linear, calculate SNR, convert back to dB
-                    noise_power = 10 ** (noise_power_db / 10)
-                    signal_plus_noise = 10 ** (signal_plus_noise_db / 10)
-                    
-                    # Guard against division by zero
-                    if noise_power > 0:
-                        snr_linear = signal_plus_noise / noise_power - 1
-                        if snr_linear > 0:
-                            status['snr'] = 10 * math.log10(snr_linear)
-                except (ValueError, ZeroDivisionError, OverflowError):
-                    # SNR calculation failed, skip it
-                    pass
+        Returns:
+            Dictionary containing decoded status fields
+        """
+        status = decode_status_tlv(buffer)
         
         # Track status received
         self.metrics.status_received += 1
@@ -2263,17 +2441,10 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_double(cmdbuffer, StatusType.DOPPLER_FREQUENCY, doppler_hz)
-        encode_double(cmdbuffer, StatusType.DOPPLER_FREQUENCY_RATE, doppler_rate_hz_per_sec)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting Doppler for SSRC {ssrc}: freq={doppler_hz} Hz, rate={doppler_rate_hz_per_sec} Hz/s")
-        self.send_command(cmdbuffer)
+        logger.info("Setting Doppler for SSRC %s: freq=%s Hz, rate=%s Hz/s", ssrc, doppler_hz, doppler_rate_hz_per_sec)
+        self._send_tlv(ssrc,
+                       ('d', StatusType.DOPPLER_FREQUENCY, doppler_hz),
+                       ('d', StatusType.DOPPLER_FREQUENCY_RATE, doppler_rate_hz_per_sec))
     
     def set_pll(self, ssrc: int, enable: bool, bandwidth_hz: Optional[float] = None, square: bool = False):
         """
@@ -2304,10 +2475,10 @@ class RadiodControl:
             encode_int(cmdbuffer, StatusType.PLL_SQUARE, 1)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting PLL for SSRC {ssrc}: enable={enable}, bw={bandwidth_hz} Hz, square={square}")
+        logger.info("Setting PLL for SSRC %s: enable=%s, bw=%s Hz, square=%s", ssrc, enable, bandwidth_hz, square)
         self.send_command(cmdbuffer)
     
     def set_squelch(self, ssrc: int, enable: bool = True, open_snr_db: Optional[float] = None, 
@@ -2337,10 +2508,10 @@ class RadiodControl:
             encode_float(cmdbuffer, StatusType.SQUELCH_CLOSE, close_snr_db)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting squelch for SSRC {ssrc}: enable={enable}, open={open_snr_db} dB, close={close_snr_db} dB")
+        logger.info("Setting squelch for SSRC %s: enable=%s, open=%s dB, close=%s dB", ssrc, enable, open_snr_db, close_snr_db)
         self.send_command(cmdbuffer)
     
     def set_output_channels(self, ssrc: int, channels: int):
@@ -2362,16 +2533,8 @@ class RadiodControl:
         if channels not in [1, 2]:
             raise ValidationError(f"Invalid channel count: {channels} (must be 1 or 2)")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OUTPUT_CHANNELS, channels)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting output channels for SSRC {ssrc} to {channels}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting output channels for SSRC %s to %s", ssrc, channels)
+        self._send_tlv(ssrc, ('i', StatusType.OUTPUT_CHANNELS, channels))
     
     def set_envelope_detection(self, ssrc: int, enable: bool):
         """
@@ -2386,16 +2549,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.ENVELOPE, 1 if enable else 0)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting envelope detection for SSRC {ssrc}: {enable}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting envelope detection for SSRC %s: %s", ssrc, enable)
+        self._send_tlv(ssrc, ('i', StatusType.ENVELOPE, 1 if enable else 0))
     
     def set_independent_sideband(self, ssrc: int, enable: bool):
         """
@@ -2412,16 +2567,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.INDEPENDENT_SIDEBAND, 1 if enable else 0)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting ISB mode for SSRC {ssrc}: {enable}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting ISB mode for SSRC %s: %s", ssrc, enable)
+        self._send_tlv(ssrc, ('i', StatusType.INDEPENDENT_SIDEBAND, 1 if enable else 0))
     
     def set_fm_threshold_extension(self, ssrc: int, enable: bool):
         """
@@ -2436,16 +2583,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.THRESH_EXTEND, 1 if enable else 0)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting FM threshold extension for SSRC {ssrc}: {enable}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting FM threshold extension for SSRC %s: %s", ssrc, enable)
+        self._send_tlv(ssrc, ('i', StatusType.THRESH_EXTEND, 1 if enable else 0))
     
     def set_agc_threshold(self, ssrc: int, threshold_db: float):
         """
@@ -2460,16 +2599,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_float(cmdbuffer, StatusType.AGC_THRESHOLD, threshold_db)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting AGC threshold for SSRC {ssrc}: {threshold_db} dB")
-        self.send_command(cmdbuffer)
+        logger.info("Setting AGC threshold for SSRC %s: %s dB", ssrc, threshold_db)
+        self._send_tlv(ssrc, ('f', StatusType.AGC_THRESHOLD, threshold_db))
     
     def set_opus_bitrate(self, ssrc: int, bitrate: int):
         """
@@ -2487,16 +2618,8 @@ class RadiodControl:
         if bitrate < 0:
             raise ValidationError(f"Bitrate must be non-negative, got {bitrate}")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OPUS_BIT_RATE, bitrate)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting Opus bitrate for SSRC {ssrc}: {bitrate} bps")
-        self.send_command(cmdbuffer)
+        logger.info("Setting Opus bitrate for SSRC %s: %s bps", ssrc, bitrate)
+        self._send_tlv(ssrc, ('i', StatusType.OPUS_BIT_RATE, bitrate))
     
     def set_opus_dtx(self, ssrc: int, enable: bool):
         """
@@ -2518,10 +2641,10 @@ class RadiodControl:
         
         encode_bool(cmdbuffer, StatusType.OPUS_DTX, enable)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting Opus DTX for SSRC {ssrc}: {enable}")
+        logger.info("Setting Opus DTX for SSRC %s: %s", ssrc, enable)
         self.send_command(cmdbuffer)
     
     def set_opus_application(self, ssrc: int, application: int):
@@ -2542,16 +2665,8 @@ class RadiodControl:
         if application not in [2048, 2049, 2051]:
             raise ValidationError(f"Invalid Opus application type: {application}")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OPUS_APPLICATION, application)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting Opus application for SSRC {ssrc}: {application}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting Opus application for SSRC %s: %s", ssrc, application)
+        self._send_tlv(ssrc, ('i', StatusType.OPUS_APPLICATION, application))
     
     def set_opus_bandwidth(self, ssrc: int, bandwidth: int):
         """
@@ -2573,16 +2688,8 @@ class RadiodControl:
         if bandwidth not in [1101, 1102, 1103, 1104, 1105]:
             raise ValidationError(f"Invalid Opus bandwidth: {bandwidth}")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OPUS_BANDWIDTH, bandwidth)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting Opus bandwidth for SSRC {ssrc}: {bandwidth}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting Opus bandwidth for SSRC %s: %s", ssrc, bandwidth)
+        self._send_tlv(ssrc, ('i', StatusType.OPUS_BANDWIDTH, bandwidth))
     
     def set_opus_fec(self, ssrc: int, loss_percent: int):
         """
@@ -2601,16 +2708,8 @@ class RadiodControl:
         if not (0 <= loss_percent <= 100):
             raise ValidationError(f"Loss percent must be 0-100, got {loss_percent}")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OPUS_FEC, loss_percent)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting Opus FEC for SSRC {ssrc}: {loss_percent}% expected loss")
-        self.send_command(cmdbuffer)
+        logger.info("Setting Opus FEC for SSRC %s: %s%% expected loss", ssrc, loss_percent)
+        self._send_tlv(ssrc, ('i', StatusType.OPUS_FEC, loss_percent))
     
     def set_max_delay(self, ssrc: int, max_blocks: int):
         """
@@ -2633,16 +2732,8 @@ class RadiodControl:
         if not (0 <= max_blocks <= 5):
             raise ValidationError(f"max_blocks must be 0-5, got {max_blocks}")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.MAXDELAY, max_blocks)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting max delay for SSRC {ssrc}: {max_blocks} blocks")
-        self.send_command(cmdbuffer)
+        logger.info("Setting max delay for SSRC %s: %s blocks", ssrc, max_blocks)
+        self._send_tlv(ssrc, ('i', StatusType.MAXDELAY, max_blocks))
     
     # Backward compatibility alias
     def set_packet_buffering(self, ssrc: int, min_blocks: int):
@@ -2676,10 +2767,10 @@ class RadiodControl:
             encode_float(cmdbuffer, StatusType.FILTER2_KAISER_BETA, kaiser_beta)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting filter2 for SSRC {ssrc}: blocksize={blocksize}, beta={kaiser_beta}")
+        logger.info("Setting filter2 for SSRC %s: blocksize=%s, beta=%s", ssrc, blocksize, kaiser_beta)
         self.send_command(cmdbuffer)
     
     def set_spectrum(self, ssrc: int, bin_bw_hz: Optional[float] = None, bin_count: Optional[int] = None,
@@ -2716,10 +2807,10 @@ class RadiodControl:
             encode_float(cmdbuffer, StatusType.SPECTRUM_SHAPE, kaiser_beta)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting spectrum for SSRC {ssrc}: bw={bin_bw_hz} Hz, bins={bin_count}, crossover={crossover_hz} Hz")
+        logger.info("Setting spectrum for SSRC %s: bw=%s Hz, bins=%s, crossover=%s Hz", ssrc, bin_bw_hz, bin_count, crossover_hz)
         self.send_command(cmdbuffer)
     
     def set_status_interval(self, ssrc: int, interval: int):
@@ -2738,16 +2829,8 @@ class RadiodControl:
         if interval < 0:
             raise ValidationError(f"interval must be non-negative, got {interval}")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.STATUS_INTERVAL, interval)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting status interval for SSRC {ssrc}: {interval} frames")
-        self.send_command(cmdbuffer)
+        logger.info("Setting status interval for SSRC %s: %s frames", ssrc, interval)
+        self._send_tlv(ssrc, ('i', StatusType.STATUS_INTERVAL, interval))
     
     def set_demod_type(self, ssrc: int, demod_type: int):
         """
@@ -2767,16 +2850,8 @@ class RadiodControl:
         if not (0 <= demod_type <= 4):
             raise ValidationError(f"Invalid demod_type: {demod_type} (must be 0-4)")
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.DEMOD_TYPE, demod_type)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting demod type for SSRC {ssrc}: {demod_type}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting demod type for SSRC %s: %s", ssrc, demod_type)
+        self._send_tlv(ssrc, ('i', StatusType.DEMOD_TYPE, demod_type))
     
     def set_output_encoding(self, ssrc: int, encoding: int):
         """
@@ -2794,16 +2869,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_int(cmdbuffer, StatusType.OUTPUT_ENCODING, encoding)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting output encoding for SSRC {ssrc}: {encoding}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting output encoding for SSRC %s: %s", ssrc, encoding)
+        self._send_tlv(ssrc, ('i', StatusType.OUTPUT_ENCODING, encoding))
     
     def set_rf_gain(self, ssrc: int, gain_db: float):
         """
@@ -2821,16 +2888,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_float(cmdbuffer, StatusType.RF_GAIN, gain_db)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting RF gain for SSRC {ssrc}: {gain_db} dB")
-        self.send_command(cmdbuffer)
+        logger.info("Setting RF gain for SSRC %s: %s dB", ssrc, gain_db)
+        self._send_tlv(ssrc, ('f', StatusType.RF_GAIN, gain_db))
     
     def set_rf_attenuation(self, ssrc: int, atten_db: float):
         """
@@ -2848,16 +2907,8 @@ class RadiodControl:
         """
         _validate_ssrc(ssrc)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_float(cmdbuffer, StatusType.RF_ATTEN, atten_db)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting RF attenuation for SSRC {ssrc}: {atten_db} dB")
-        self.send_command(cmdbuffer)
+        logger.info("Setting RF attenuation for SSRC %s: %s dB", ssrc, atten_db)
+        self._send_tlv(ssrc, ('f', StatusType.RF_ATTEN, atten_db))
     
     def set_destination(self, ssrc: int, address: str, port: int = 5004):
         """
@@ -2882,10 +2933,10 @@ class RadiodControl:
         
         encode_socket(cmdbuffer, StatusType.OUTPUT_DATA_DEST_SOCKET, address, port)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting destination for SSRC {ssrc}: {address}:{port}")
+        logger.info("Setting destination for SSRC %s: %s:%s", ssrc, address, port)
         self.send_command(cmdbuffer)
     
     def set_first_lo(self, ssrc: int, frequency_hz: float):
@@ -2901,19 +2952,10 @@ class RadiodControl:
         Example:
             >>> control.set_first_lo(ssrc=12345, frequency_hz=14.1e6)
         """
-        _validate_ssrc(ssrc)
-        _validate_frequency(frequency_hz)
+        _validate_ssrc_frequency(ssrc, frequency_hz)
         
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        
-        encode_double(cmdbuffer, StatusType.FIRST_LO_FREQUENCY, frequency_hz)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        
-        logger.info(f"Setting first LO frequency for SSRC {ssrc}: {frequency_hz/1e6:.3f} MHz")
-        self.send_command(cmdbuffer)
+        logger.info("Setting first LO frequency for SSRC %s: %.3f MHz", ssrc, frequency_hz/1e6)
+        self._send_tlv(ssrc, ('d', StatusType.FIRST_LO_FREQUENCY, frequency_hz))
     
     def set_options(self, ssrc: int, set_bits: int = 0, clear_bits: int = 0):
         """
@@ -2941,10 +2983,10 @@ class RadiodControl:
             encode_int64(cmdbuffer, StatusType.CLEAROPTS, clear_bits)
         
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         
-        logger.info(f"Setting options for SSRC {ssrc}: set=0x{set_bits:x}, clear=0x{clear_bits:x}")
+        logger.info("Setting options for SSRC %s: set=0x%x, clear=0x%x", ssrc, set_bits, clear_bits)
         self.send_command(cmdbuffer)
     
     # ------------------------------------------------------------------
@@ -2954,38 +2996,20 @@ class RadiodControl:
     def set_lock(self, ssrc: int, lock: bool):
         """Lock/unlock the tuner (ignore retune commands when locked)."""
         _validate_ssrc(ssrc)
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        encode_int(cmdbuffer, StatusType.LOCK, 1 if lock else 0)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        logger.info(f"Setting LOCK={lock} for SSRC {ssrc}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting LOCK=%s for SSRC %s", lock, ssrc)
+        self._send_tlv(ssrc, ('i', StatusType.LOCK, 1 if lock else 0))
 
     def set_pl_tone(self, ssrc: int, freq_hz: float):
         """Set FM PL (CTCSS) tone-squelch frequency in Hz. 0 disables."""
         _validate_ssrc(ssrc)
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        encode_float(cmdbuffer, StatusType.PL_TONE, freq_hz)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        logger.info(f"Setting PL tone = {freq_hz} Hz for SSRC {ssrc}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting PL tone = %s Hz for SSRC %s", freq_hz, ssrc)
+        self._send_tlv(ssrc, ('f', StatusType.PL_TONE, freq_hz))
 
     def set_headroom(self, ssrc: int, headroom_db: float):
         """Set audio-level headroom (dB below full scale, typically negative)."""
         _validate_ssrc(ssrc)
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        encode_float(cmdbuffer, StatusType.HEADROOM, headroom_db)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
-        logger.info(f"Setting headroom = {headroom_db} dB for SSRC {ssrc}")
-        self.send_command(cmdbuffer)
+        logger.info("Setting headroom = %s dB for SSRC %s", headroom_db, ssrc)
+        self._send_tlv(ssrc, ('f', StatusType.HEADROOM, headroom_db))
 
     def set_agc_hangtime(self, ssrc: int, seconds: float):
         """Set AGC hang time in seconds."""
@@ -2994,8 +3018,8 @@ class RadiodControl:
         cmdbuffer.append(CMD)
         encode_float(cmdbuffer, StatusType.AGC_HANGTIME, seconds)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         self.send_command(cmdbuffer)
 
     def set_agc_recovery_rate(self, ssrc: int, db_per_sec: float):
@@ -3005,8 +3029,8 @@ class RadiodControl:
         cmdbuffer.append(CMD)
         encode_float(cmdbuffer, StatusType.AGC_RECOVERY_RATE, db_per_sec)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         self.send_command(cmdbuffer)
 
     def set_kaiser_beta(self, ssrc: int, beta: float):
@@ -3020,8 +3044,8 @@ class RadiodControl:
         cmdbuffer.append(CMD)
         encode_string(cmdbuffer, StatusType.DESCRIPTION, description)
         encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, secrets.randbits(31))
-        encode_eol(cmdbuffer)
+        _encode_tag(cmdbuffer, next_command_tag())
+        cmdbuffer += _EOL
         self.send_command(cmdbuffer)
 
     # ------------------------------------------------------------------
@@ -3035,26 +3059,18 @@ class RadiodControl:
         a command containing only the SSRC + command tag, which radiod
         answers with a full status packet.
         """
-        import select
-        import time as _time
-        from .status import decode_status_packet
-
         _validate_ssrc(ssrc)
         _validate_timeout(timeout)
 
-        command_tag = secrets.randbits(31)
-        cmdbuffer = bytearray()
-        cmdbuffer.append(CMD)
-        encode_int(cmdbuffer, StatusType.COMMAND_TAG, command_tag)
-        encode_int(cmdbuffer, StatusType.OUTPUT_SSRC, ssrc)
-        encode_eol(cmdbuffer)
+        command_tag = next_command_tag()
+        cmdbuffer = _build_poll_command(ssrc, command_tag)
 
         status_sock = self._get_or_create_status_listener()
-        start = _time.time()
+        start = time.time()
         last_send = 0.0
         retry = 0.1
-        while _time.time() - start < timeout:
-            now = _time.time()
+        while time.time() - start < timeout:
+            now = time.time()
             if now - last_send >= retry:
                 self.send_command(cmdbuffer)
                 last_send = now
@@ -3065,7 +3081,7 @@ class RadiodControl:
                 continue
             try:
                 buf, _addr = status_sock.recvfrom(8192)
-            except socket.timeout:
+            except (BlockingIOError, socket.timeout):
                 continue
             st = decode_status_packet(buf)
             if st is None:
@@ -3083,22 +3099,18 @@ class RadiodControl:
         optionally filtering by SSRC. Blocks for ``duration`` seconds, or
         indefinitely if None.
         """
-        import select
-        import time as _time
-        from .status import decode_status_packet
-
         status_sock = self._get_or_create_status_listener()
-        start = _time.time()
+        start = time.time()
         while True:
-            if duration is not None and _time.time() - start >= duration:
+            if duration is not None and time.time() - start >= duration:
                 return
-            remaining = None if duration is None else max(0.0, duration - (_time.time() - start))
+            remaining = None if duration is None else max(0.0, duration - (time.time() - start))
             ready = select.select([status_sock], [], [], 0.5 if remaining is None else min(0.5, remaining))
             if not ready[0]:
                 continue
             try:
                 buf, _addr = status_sock.recvfrom(8192)
-            except socket.timeout:
+            except (BlockingIOError, socket.timeout):
                 continue
             st = decode_status_packet(buf)
             if st is None or st.ssrc is None:
@@ -3118,6 +3130,10 @@ class RadiodControl:
         """
         errors = []
         
+        # Wake any sender sleeping in retry backoff
+        if self._shutdown_event is not None:
+            self._shutdown_event.set()
+        
         # Close control socket
         if self.socket:
             try:
@@ -6,6 +6,7 @@ to radiod's status multicast stream (native Python) or optionally using
 the 'control' utility from ka9q-radio as a fallback.
 """
 
+import bisect
 import subprocess
 import re
 import logging
@@ -13,8 +14,10 @@ import time
 import select
 import socket
 import struct
+import sys
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+from ._status_decoder import decode_status_tlv
 from .utils import resolve_multicast_address
 
 logger = logging.getLogger(__name__)
@@ -36,6 +39,36 @@ class ChannelInfo:
     chain_delay_correction_ns: Optional[int] = None  # L6 BPSK PPS chain-delay calibration (nanoseconds)
 
 
+# Most status packets discover_channels_native() reads per select() wakeup
+_RECV_BATCH = 64
+
+# Linux IP_MULTICAST_ALL (not exported by the socket module). With the
+# default of 1 a socket bound to 0.0.0.0:5006 also receives every other
+# group joined on the host, e.g. the status groups of other radiods.
+_IP_MULTICAST_ALL = getattr(socket, 'IP_MULTICAST_ALL',
+                            49 if sys.platform.startswith('linux') else None)
+
+# recvmsg_into() reports MSG_TRUNC for packets larger than the receive
+# buffer; platforms without it (Windows) fall back to recvfrom_into()
+_HAS_RECVMSG = hasattr(socket.socket, 'recvmsg_into')
+_MSG_TRUNC = getattr(socket, 'MSG_TRUNC', 0)
+
+# Status bursts from a busy radiod can overflow the default receive buffer
+_STATUS_RCVBUF = 2 * 1024 * 1024
+
+# struct ip_mreq: multicast group, local interface
+_MREQ_STRUCT = struct.Struct('=4s4s')
+_INADDR_ANY = bytes(4)
+
+# One channel row of `control -v` output:
+#   SSRC  preset  samprate  freq,Hz  SNR  addr[:port]
+# Anchoring on the leading SSRC digits skips the header and summary lines.
+_CTRL_LINE_RE = re.compile(
+    r'^\s*(\d+)\s+(\S+)\s+([\d,]+)\s+([\d,.-]+)\s+(\S+)\s+(\S+?)(?::(\d+))?(?:\s|$)'
+)
+_COMMA_STRIP = str.maketrans('', '', ',')
+
+
 def _create_status_listener_socket(multicast_addr: str, interface: Optional[str] = None) -> socket.socket:
     """
     Create a UDP socket configured to listen for radiod status multicast.
@@ -71,22 +104,35 @@ def _create_status_listener_socket(multicast_addr: str, interface: Optional[str]
         logger.error(f"Failed to bind socket to port 5006: {e}")
         raise
     
+    # Only deliver the group joined below, not every group on the host
+    if _IP_MULTICAST_ALL is not None:
+        try:
+            sock.setsockopt(socket.IPPROTO_IP, _IP_MULTICAST_ALL, 0)
+        except OSError as e:
+            logger.debug(f"Could not clear IP_MULTICAST_ALL: {e}")
+    
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _STATUS_RCVBUF)
+    except OSError as e:
+        logger.debug(f"Could not set SO_RCVBUF: {e}")
+    
     # Join multicast group on specified interface (or any interface if not specified)
     interface_addr = interface if interface else '0.0.0.0'
-    mreq = struct.pack('=4s4s',
-                      socket.inet_aton(multicast_addr),  # multicast group
-                      socket.inet_aton(interface_addr))  # interface to use
+    mreq = _MREQ_STRUCT.pack(socket.inet_aton(multicast_addr),  # multicast group
+                             socket.inet_aton(interface) if interface else _INADDR_ANY)
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
     logger.debug(f"Joined multicast group {multicast_addr} on interface {interface_addr}")
     
-    # Set timeout for non-blocking reception
-    sock.settimeout(0.1)
+    # Non-blocking: discovery waits in select() and then drains what is
+    # queued until the receive call raises BlockingIOError
+    sock.setblocking(False)
     
     return sock
 
 
 def discover_channels_native(status_address: str, listen_duration: float = 2.0, 
-                            interface: Optional[str] = None) -> Dict[int, ChannelInfo]:
+                            interface: Optional[str] = None,
+                            stability_window: Optional[float] = 0.5) -> Dict[int, ChannelInfo]:
     """
     Discover channels by listening to radiod status multicast (pure Python)
     
@@ -99,19 +145,20 @@ def discover_channels_native(status_address: str, listen_duration: float = 2.0,
         interface: IP address of the network interface to use for multicast reception
                   (e.g., '192.168.1.100'). Required on multi-homed systems.
                   If None, uses INADDR_ANY which works on single-homed systems.
+        stability_window: Stop early once this many seconds pass without a new
+                  SSRC appearing (default: 0.5). Listening never stops before the
+                  first channel is seen, and never runs past listen_duration.
+                  None always listens for the full listen_duration.
         
     Returns:
         Dictionary mapping SSRC to ChannelInfo
     """
-    # Import decoder function without creating full RadiodControl instance
-    from .control import RadiodControl
-    
     logger.info(f"Discovering channels via native Python listener from {status_address}")
-    logger.info(f"Listening for {listen_duration} seconds...")
+    logger.info(f"Listening for up to {listen_duration} seconds...")
     
     channels = {}
+    sigs = {}  # ssrc -> stable fields (tuning, format, destination) of channels[ssrc]
     status_sock = None  # Initialize outside try block
-    temp_control = None  # Initialize outside try block
     
     try:
         # Resolve address and create lightweight socket (no RadiodControl overhead)
@@ -119,7 +166,6 @@ def discover_channels_native(status_address: str, listen_duration: float = 2.0,
         status_sock = _create_status_listener_socket(multicast_addr, interface)
         
         # CRITICAL: Send a poll to radiod to trigger STATUS packet broadcasts
-        # We need to send this BEFORE creating RadiodControl to avoid socket conflicts
         logger.debug("Sending poll to radiod to trigger STATUS broadcasts")
         try:
             import random
@@ -145,83 +191,116 @@ def discover_channels_native(status_address: str, listen_duration: float = 2.0,
         except Exception as e:
             logger.warning(f"Could not send poll (continuing anyway): {e}")
         
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + listen_duration
+        end_time = deadline  # pulled in once the channel set stops growing
+        now = start_time
         packet_count = 0
         
-        # We'll create temp_control lazily only when we need to decode a packet
-        # This avoids opening an extra socket that would compete for multicast packets
-        temp_control = None
+        # Every packet is received into this one buffer; each is fully
+        # decoded into a ChannelInfo before the next one is received
+        rxbuf = bytearray(8192)
+        rxview = memoryview(rxbuf)
+        rxbufs = [rxbuf]
+        flags = 0
         
-        while time.time() - start_time < listen_duration:
-            # Use remaining time or 0.5s, whichever is smaller (adaptive timeout)
-            remaining = listen_duration - (time.time() - start_time)
-            select_timeout = min(remaining, 0.5)
-            
-            ready = select.select([status_sock], [], [], select_timeout)
+        while now < end_time:
+            # Sleep until a packet arrives or the listen window closes
+            ready = select.select([status_sock], [], [], end_time - now)
+            now = time.monotonic()
             if not ready[0]:
                 continue
             
-            # Receive status packet
-            try:
-                buffer, addr = status_sock.recvfrom(8192)
+            # Drain the packets already queued (up to _RECV_BATCH) before
+            # going back to select(); the non-blocking socket raises
+            # BlockingIOError once the queue is empty
+            for _ in range(_RECV_BATCH):
+                try:
+                    if _HAS_RECVMSG:
+                        nbytes, _, flags, addr = status_sock.recvmsg_into(rxbufs)
+                    else:
+                        nbytes, addr = status_sock.recvfrom_into(rxbuf)
+                except BlockingIOError:
+                    break
+                except Exception as e:
+                    logger.debug(f"Error receiving packet: {e}")
+                    break
                 packet_count += 1
-                logger.debug(f"Received {len(buffer)} bytes from {addr}")
-            except Exception as e:
-                logger.debug(f"Error receiving packet: {e}")
-                continue
-            
-            # Skip non-status packets (STATUS = 0, COMMAND = 1)
-            if len(buffer) == 0 or buffer[0] != 0:  # STATUS packets have type byte == 0
-                logger.debug(f"Skipping non-STATUS packet (type={buffer[0] if buffer else 'empty'})")
-                continue
-            
-            # Decode status packet using temporary control instance
-            # Create it lazily on first STATUS packet
-            if temp_control is None:
-                logger.debug("Creating RadiodControl for decoding")
-                temp_control = RadiodControl(status_address)
-            
-            try:
-                status = temp_control._decode_status_response(buffer)
-            except Exception as e:
-                logger.debug(f"Error decoding status packet: {e}")
-                continue
-            
-            # Extract SSRC - required field
-            ssrc = status.get('ssrc')
-            if not ssrc:
-                logger.debug("Status packet missing SSRC, skipping")
-                continue
-            
-            # Build ChannelInfo from status
-            # Extract destination socket info
-            dest = status.get('destination', {})
-            mcast_addr = dest.get('address', '') if isinstance(dest, dict) else ''
-            port = dest.get('port', 0) if isinstance(dest, dict) else 0
-            
-            channel = ChannelInfo(
-                ssrc=ssrc,
-                preset=status.get('preset', 'unknown'),
-                sample_rate=status.get('sample_rate', 0),
-                frequency=status.get('frequency', 0.0),
-                snr=status.get('snr', float('-inf')),
-                multicast_address=mcast_addr,
-                port=port,
-                gps_time=status.get('gps_time'),
-                rtp_timesnap=status.get('rtp_timesnap'),
-                encoding=status.get('encoding', 0)
-            )
-            
-            # Store or update channel info
-            if ssrc not in channels:
-                channels[ssrc] = channel
-                logger.debug(
-                    f"Discovered channel: SSRC={ssrc}, freq={channel.frequency/1e6:.3f} MHz, "
-                    f"rate={channel.sample_rate} Hz, preset={channel.preset}"
+                if flags & _MSG_TRUNC:
+                    # The tail was dropped; decoding the rest would misread TLVs
+                    logger.debug("Skipping truncated packet from %s", addr)
+                    continue
+                buffer = rxview[:nbytes]
+                logger.debug("Received %d bytes from %s", nbytes, addr)
+                
+                # Skip non-status packets (STATUS = 0, COMMAND = 1)
+                if len(buffer) == 0 or buffer[0] != 0:  # STATUS packets have type byte == 0
+                    logger.debug(f"Skipping non-STATUS packet (type={buffer[0] if buffer else 'empty'})")
+                    continue
+                
+                try:
+                    status = decode_status_tlv(buffer)
+                except Exception as e:
+                    logger.debug(f"Error decoding status packet: {e}")
+                    continue
+                
+                # Extract SSRC - required field
+                ssrc = status.get('ssrc')
+                if not ssrc:
+                    logger.debug("Status packet missing SSRC, skipping")
+                    continue
+                
+                # Build ChannelInfo from status
+                # Extract destination socket info
+                dest = status.get('destination', {})
+                mcast_addr = dest.get('address', '') if isinstance(dest, dict) else ''
+                port = dest.get('port', 0) if isinstance(dest, dict) else 0
+                
+                preset = status.get('preset', 'unknown')
+                sample_rate = status.get('sample_rate', 0)
+                frequency = status.get('frequency', 0.0)
+                encoding = status.get('encoding', 0)
+                snr = status.get('snr', float('-inf'))
+                gps_time = status.get('gps_time')
+                rtp_timesnap = status.get('rtp_timesnap')
+                
+                # radiod refreshes S/N and the timing snapshot in every status
+                # packet; when only those moved, update the entry in place
+                # instead of building a new ChannelInfo
+                sig = (preset, sample_rate, frequency, encoding, mcast_addr, port)
+                if sigs.get(ssrc) == sig:
+                    channel = channels[ssrc]
+                    channel.snr = snr
+                    channel.gps_time = gps_time
+                    channel.rtp_timesnap = rtp_timesnap
+                    continue
+                sigs[ssrc] = sig
+                
+                channel = ChannelInfo(
+                    ssrc=ssrc,
+                    preset=preset,
+                    sample_rate=sample_rate,
+                    frequency=frequency,
+                    snr=snr,
+                    multicast_address=mcast_addr,
+                    port=port,
+                    gps_time=gps_time,
+                    rtp_timesnap=rtp_timesnap,
+                    encoding=encoding
                 )
-            else:
-                # Update with latest info
-                channels[ssrc] = channel
+                
+                # Store or update channel info
+                if ssrc not in channels:
+                    channels[ssrc] = channel
+                    if stability_window is not None:
+                        end_time = min(deadline, now + stability_window)
+                    logger.debug(
+                        f"Discovered channel: SSRC={ssrc}, freq={channel.frequency/1e6:.3f} MHz, "
+                        f"rate={channel.sample_rate} Hz, preset={channel.preset}"
+                    )
+                else:
+                    # Update with latest info
+                    channels[ssrc] = channel
         
         logger.info(f"Discovered {len(channels)} channels from {packet_count} packets")
         
@@ -237,14 +316,6 @@ def discover_channels_native(status_address: str, listen_duration: float = 2.0,
                 logger.debug("Discovery socket closed successfully")
             except Exception as e:
                 logger.warning(f"Error closing discovery socket: {e}")
-        
-        # Clean up temporary RadiodControl instance
-        if temp_control:
-            try:
-                temp_control.close()
-                logger.debug("Temporary control instance closed")
-            except Exception as e:
-                logger.debug(f"Error closing temporary control: {e}")
     
     return channels
 
@@ -284,33 +355,22 @@ def discover_channels_via_control(status_address: str, timeout: float = 30.0) ->
         # Format: SSRC    preset   samprate      freq, Hz   SNR output channel
         #        60000        iq     16,000        60,000   9.5 239.41.204.101:5004
         
-        for line in output.split('\n'):
-            # Skip header and non-data lines
-            if 'SSRC' in line or 'channels' in line or not line.strip():
-                continue
-            
-            # Parse channel line
-            # Pattern: whitespace-separated values
-            parts = line.split()
-            if len(parts) < 6:
+        for line in output.splitlines():
+            m = _CTRL_LINE_RE.match(line)
+            if not m:
                 continue
             
             try:
-                ssrc = int(parts[0])
-                preset = parts[1]
-                sample_rate = int(parts[2].replace(',', ''))
-                frequency = float(parts[3].replace(',', ''))
-                snr_str = parts[4]
-                snr = float(snr_str) if snr_str != '-inf' else float('-inf')
-                
-                # Parse multicast address:port
-                addr_port = parts[5]
-                if ':' in addr_port:
-                    addr, port_str = addr_port.rsplit(':', 1)
-                    port = int(port_str)
-                else:
-                    addr = addr_port
-                    port = 5004  # default
+                ssrc_str, preset, rate_str, freq_str, snr_str, addr, port_str = m.groups()
+                ssrc = int(ssrc_str)
+                sample_rate = int(rate_str.translate(_COMMA_STRIP))
+                frequency = float(freq_str.translate(_COMMA_STRIP))
+                snr = float(snr_str)
+                if port_str is None and ':' in addr:
+                    # The regex gave up on a non-numeric port; int() rejects
+                    # it so the line is skipped rather than kept as a bogus address
+                    addr, port_str = addr.rsplit(':', 1)
+                port = int(port_str) if port_str is not None else 5004  # default
                 
                 channel = ChannelInfo(
                     ssrc=ssrc,
@@ -326,12 +386,12 @@ def discover_channels_via_control(status_address: str, timeout: float = 30.0) ->
                 channels[ssrc] = channel
                 
                 logger.debug(
-                    f"Found channel: SSRC={ssrc}, freq={frequency/1e6:.3f} MHz, "
-                    f"rate={sample_rate} Hz, preset={preset}, addr={addr}:{port}"
+                    "Found channel: SSRC=%d, freq=%.3f MHz, rate=%d Hz, preset=%s, addr=%s:%d",
+                    ssrc, frequency / 1e6, sample_rate, preset, addr, port
                 )
                 
-            except (ValueError, IndexError) as e:
-                logger.debug(f"Could not parse line: {line} - {e}")
+            except ValueError as e:
+                logger.debug("Could not parse line: %s - %s", line, e)
                 continue
         
         logger.info(f"Discovered {len(channels)} channels")
@@ -400,15 +460,31 @@ def find_channels_by_frequencies(
     """
     all_channels = discover_channels(status_address)
     
+    # Sort once and bisect per target instead of scanning every channel.
+    # The discovery order breaks ties, as the old linear scan did.
+    entries = sorted(
+        (channel.frequency, order, channel)
+        for order, channel in enumerate(all_channels.values())
+    )
+    freq_arr = [entry[0] for entry in entries]
+    
     matched = {}
     
     for target_freq in frequencies:
+        i = bisect.bisect_left(freq_arr, target_freq)
+        candidates = []
+        if i < len(entries):
+            candidates.append(entries[i])
+        if i > 0:
+            # First-discovered channel among those sharing the next lower frequency
+            candidates.append(entries[bisect.bisect_left(freq_arr, freq_arr[i - 1])])
+        
         best_match = None
         best_diff = float('inf')
-        
-        for ssrc, channel in all_channels.items():
-            diff = abs(channel.frequency - target_freq)
-            if diff < tolerance and diff < best_diff:
+        if candidates:
+            freq, _, channel = min(candidates, key=lambda e: (abs(e[0] - target_freq), e[1]))
+            diff = abs(freq - target_freq)
+            if diff < tolerance:
                 best_match = channel
                 best_diff = diff
         
@@ -457,23 +533,29 @@ def discover_radiod_services(timeout: float = 10.0):
     """
     Discover all radiod services on the network via mDNS
     
+    avahi-daemon's cache is read first (``avahi-browse -c``), which returns
+    at once without waiting on the network. Only if the cache holds no
+    radiod services is a full terminating browse (``-t``) run.
+    
     Args:
         timeout: Maximum time to wait for avahi-browse (default 10 seconds)
     
     Returns:
         List of dicts with "name" and "address" keys
     """
-    import subprocess
-    
     # Use dict to automatically deduplicate by address
     services_dict = {}
-    try:
-        result = subprocess.run(
-            ["avahi-browse", "-t", "_ka9q-ctl._udp", "-p", "-r"],
-            capture_output=True,
-            text=True,
-            timeout=timeout
-        )
+    for mode in ("-c", "-t"):
+        try:
+            result = subprocess.run(
+                ["avahi-browse", mode, "_ka9q-ctl._udp", "-p", "-r"],
+                capture_output=True,
+                text=True,
+                timeout=timeout
+            )
+        except Exception as e:
+            logger.warning(f"Failed to discover radiod services: {e}")
+            break
         
         for line in result.stdout.split("\n"):
             if line.startswith("="):
@@ -483,8 +565,10 @@ def discover_radiod_services(timeout: float = 10.0):
                     address = parts[7]
                     # Use address as key to deduplicate
                     services_dict[address] = {"name": name, "address": address}
-    except Exception as e:
-        logger.warning(f"Failed to discover radiod services: {e}")
+        
+        if services_dict:
+            break
+        logger.debug(f"No radiod services from avahi-browse {mode}")
     
     # Convert dict back to list, sorted by name for consistency
     services = sorted(services_dict.values(), key=lambda x: x['name'])
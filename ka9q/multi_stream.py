@@ -58,6 +58,9 @@ from .stream_quality import GapEvent, GapSource, StreamQuality
 
 logger = logging.getLogger(__name__)
 
+# SSRC field of the RTP header (bytes 8-11)
+_RTP_SSRC = struct.Struct('!I')
+
 
 from ._multicast import join_multicast_all_interfaces
 
@@ -374,7 +377,7 @@ class MultiStream:
                 continue
 
             # Fast SSRC peek before full header parse
-            ssrc = struct.unpack_from("!I", data, 8)[0]
+            ssrc = _RTP_SSRC.unpack_from(data, 8)[0]
             slot = self._slots.get(ssrc)
             if slot is None:
                 if ssrc not in self._unknown_ssrcs:
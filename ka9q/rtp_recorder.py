@@ -32,6 +32,9 @@ UNIX_EPOCH = 2208988800     # Unix epoch in NTP seconds
 BILLION = 1_000_000_000
 GPS_LEAP_SECONDS = 18   # GPS time is ahead of UTC by 18 seconds (as of 2025)
 
+# Fixed 12-byte RTP header (RFC 3550): flags, marker/PT, sequence, timestamp, SSRC
+_RTP_HEADER = struct.Struct('!BBHII')
+
 
 class RecorderState(Enum):
     """Recorder state machine states"""
@@ -99,7 +102,7 @@ def parse_rtp_header(data: bytes) -> Optional[RTPHeader]:
         return None
     
     # Parse RTP header (RFC 3550)
-    byte0, byte1 = struct.unpack('!BB', data[0:2])
+    byte0, byte1, sequence, timestamp, ssrc = _RTP_HEADER.unpack_from(data)
     
     version = (byte0 >> 6) & 0x03
     padding = bool(byte0 & 0x20)
@@ -109,8 +112,6 @@ def parse_rtp_header(data: bytes) -> Optional[RTPHeader]:
     marker = bool(byte1 & 0x80)
     payload_type = byte1 & 0x7F
     
-    sequence, timestamp, ssrc = struct.unpack('!HIL', data[2:12])
-    
     return RTPHeader(
         version=version,
         padding=padding,
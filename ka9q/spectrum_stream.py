@@ -40,7 +40,7 @@ import threading
 import time
 from typing import Callable, Optional
 
-from .control import RadiodControl, encode_int, encode_float, encode_double, encode_eol
+from .control import RadiodControl, encode_int, encode_float, encode_double, encode_eol, next_command_tag
 from .status import ChannelStatus, decode_status_packet
 from .types import StatusType, DemodType, CMD
 
@@ -227,7 +227,7 @@ class SpectrumStream:
         buf = bytearray()
         buf.append(CMD)
         encode_int(buf, StatusType.OUTPUT_SSRC, self._ssrc)
-        encode_int(buf, StatusType.COMMAND_TAG, secrets.randbits(31))
+        encode_int(buf, StatusType.COMMAND_TAG, next_command_tag())
         encode_int(buf, StatusType.DEMOD_TYPE, self._demod_type)
         encode_double(buf, StatusType.RADIO_FREQUENCY, self._frequency_hz)
         encode_float(buf, StatusType.RESOLUTION_BW, self._resolution_bw)
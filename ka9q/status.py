@@ -6,20 +6,24 @@ radiod packs both the frontend state (`struct frontend`) and the channel state
 group. This module defines typed dataclasses that mirror what the C `control`
 program extracts from that packet, plus a decoder that populates them.
 
-The decoder is a superset of :meth:`RadiodControl._decode_status_response`:
-that method returns a flat dict for backward compatibility; this module returns
+The decoder is a superset of :func:`ka9q.control.decode_status_tlv`:
+that function returns a flat dict for backward compatibility; this module returns
 structured :class:`FrontendStatus` and :class:`ChannelStatus` objects suitable
 for driving the TUI, CLI, and programmatic access.
 """
 from __future__ import annotations
 
-import math
 import struct
 from dataclasses import dataclass, field, fields, asdict
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from ._status_decoder import (
+    decode_bool, decode_double, decode_float, decode_int,
+    decode_int32, decode_int64, decode_socket, decode_string,
+    _extended_len, _snr_db,
+)
 from .types import StatusType, DemodType, Encoding, WindowType
 
 
@@ -280,23 +284,11 @@ class ChannelStatus:
     @property
     def snr(self) -> Optional[float]:
         """S/N in dB using baseband power minus noise integrated over the filter."""
-        bw = self.bandwidth
-        if bw is None or bw <= 0:
-            return None
-        if self.baseband_power is None or self.noise_density is None:
-            return None
-        try:
-            noise_db = self.noise_density + 10 * math.log10(bw)
-            s_plus_n = 10 ** (self.baseband_power / 10.0)
-            n = 10 ** (noise_db / 10.0)
-            if n <= 0:
-                return None
-            lin = s_plus_n / n - 1.0
-            if lin <= 0:
-                return None
-            return 10 * math.log10(lin)
-        except (ValueError, OverflowError):
+        if (self.high_edge is None or self.low_edge is None
+                or self.baseband_power is None or self.noise_density is None):
             return None
+        return _snr_db(self.baseband_power, self.noise_density,
+                       self.low_edge, self.high_edge)
 
     @property
     def snr_per_hz(self) -> Optional[float]:
@@ -371,12 +363,6 @@ def decode_status_packet(buffer: bytes) -> Optional[ChannelStatus]:
     Returns None if the buffer is not a status packet (first byte != 0).
     Unknown or UNUSED TLV tags are silently skipped.
     """
-    # Imported here to avoid circular import at module load time.
-    from .control import (
-        decode_bool, decode_double, decode_float, decode_int,
-        decode_int32, decode_int64, decode_socket, decode_string,
-    )
-
     if not buffer or buffer[0] != 0:
         return None
 
@@ -398,12 +384,7 @@ def decode_status_packet(buffer: bytes) -> Optional[ChannelStatus]:
             break
         optlen = buffer[cp]; cp += 1
         if optlen & 0x80:
-            lol = optlen & 0x7f
-            optlen = 0
-            for _ in range(lol):
-                if cp >= n:
-                    break
-                optlen = (optlen << 8) | buffer[cp]; cp += 1
+            optlen, cp = _extended_len(buffer, cp, optlen)
         if cp + optlen > n:
             break
         data = buffer[cp:cp + optlen]
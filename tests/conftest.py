@@ -2,6 +2,7 @@
 pytest configuration for ka9q-python tests
 """
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -27,3 +28,12 @@ def radiod_address(request):
         or os.environ.get("RADIOD_ADDRESS")
         or "bee1-hf-status.local"
     )
+
+
+@pytest.fixture
+def mock_control():
+    """RadiodControl connected to a mocked socket (no network access)"""
+    from ka9q.control import RadiodControl
+    with patch('ka9q.control.socket.socket'):
+        with patch('ka9q.control.socket.getaddrinfo', return_value=[(2, 2, 17, '', ('239.1.2.3', 5006))]):
+            return RadiodControl('radiod.local')
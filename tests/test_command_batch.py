@@ -0,0 +1,105 @@
+"""
+Tests for RadiodControl.batch() deferred command sending
+"""
+import socket
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from ka9q import control as control_module
+
+
+def sent_all(sock, packets):
+    return len(packets)
+
+
+class TestCommandBatch:
+    """Tests for batch()"""
+
+    def test_commands_sent_together_on_exit_in_order(self, mock_control):
+        """Nothing goes out inside the block; one batched send follows it"""
+        with patch('ka9q.control._send_packets', side_effect=sent_all) as send_packets:
+            with mock_control.batch():
+                mock_control.set_gain(1001, 10.0)
+                mock_control.set_preset(1001, 'usb')
+                send_packets.assert_not_called()
+
+        send_packets.assert_called_once()
+        first, second = send_packets.call_args.args[1]
+        assert b'usb' not in first
+        assert b'usb' in second
+        mock_control.socket.send.assert_not_called()
+        assert mock_control.metrics.commands_sent == 2
+
+    def test_exception_discards_queue(self, mock_control):
+        """A failing block sends nothing and leaves batching off"""
+        with patch('ka9q.control._send_packets') as send_packets:
+            with pytest.raises(ValueError):
+                with mock_control.batch():
+                    mock_control.set_gain(1001, 10.0)
+                    raise ValueError("boom")
+
+        send_packets.assert_not_called()
+        mock_control.socket.send.assert_not_called()
+        mock_control.set_gain(1001, 10.0)
+        assert mock_control.socket.send.call_count == 1
+
+    def test_nested_batches_join_outer(self, mock_control):
+        """An inner batch() flushes only when the outermost block exits"""
+        with patch('ka9q.control._send_packets', side_effect=sent_all) as send_packets:
+            with mock_control.batch():
+                with mock_control.batch():
+                    mock_control.set_gain(1001, 10.0)
+                send_packets.assert_not_called()
+                mock_control.set_gain(1002, 5.0)
+
+        assert len(send_packets.call_args.args[1]) == 2
+
+    def test_other_threads_send_immediately(self, mock_control):
+        """A batch on one thread does not hold back another thread's commands"""
+        with patch('ka9q.control._send_packets', side_effect=sent_all):
+            with mock_control.batch():
+                mock_control.set_gain(1001, 10.0)
+                worker = threading.Thread(target=mock_control.set_gain, args=(1002, 5.0))
+                worker.start()
+                worker.join()
+                assert mock_control.socket.send.call_count == 1
+
+    def test_partial_send_falls_back_to_single_sends(self, mock_control):
+        """Commands the batched send did not get out are sent individually"""
+        with patch('ka9q.control._send_packets', return_value=1), \
+             patch('ka9q.control.time.monotonic_ns', return_value=0):
+            with mock_control.batch():
+                mock_control.set_gain(1001, 10.0)
+                mock_control.set_gain(1002, 5.0)
+                mock_control.set_gain(1003, 1.0)
+
+        assert mock_control.socket.send.call_count == 2
+        assert mock_control.metrics.commands_sent == 3
+        # The leftovers ride on the batch's reservation, not a second charge
+        assert mock_control._tokens == mock_control.max_commands_per_sec - 3
+
+
+class TestSendPackets:
+    """Tests for _send_packets() over a real loopback socket"""
+
+    @pytest.mark.parametrize('use_sendmmsg', [True, False])
+    def test_packets_arrive_in_order(self, use_sendmmsg):
+        if use_sendmmsg and control_module._sendmmsg is None:
+            pytest.skip("sendmmsg() not available on this platform")
+        packets = [b'\x01first', b'\x01second' * 10, b'\x01third']
+
+        rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            rx.bind(('127.0.0.1', 0))
+            rx.settimeout(1.0)
+            tx.connect(rx.getsockname())
+            sendmmsg = control_module._sendmmsg if use_sendmmsg else None
+            with patch('ka9q.control._sendmmsg', sendmmsg):
+                assert control_module._send_packets(tx, packets) == 3
+            assert [rx.recv(2048) for _ in packets] == packets
+        finally:
+            rx.close()
+            tx.close()
@@ -102,6 +102,11 @@ class TestDecodeDouble:
         result = decode_double(data, 8)
         assert result == 0.0
     
+    def test_decode_zero_length(self):
+        """Test that a compressed (zero-length) double decodes as 0.0"""
+        assert decode_double(b'', 0) == 0.0
+        assert decode_float(b'', 0) == 0.0
+    
     def test_decode_positive_double(self):
         """Test decoding positive double"""
         test_value = 3.14159265358979
@@ -247,6 +252,14 @@ class TestDecodeSocket:
         result = decode_socket(data, 8)
         assert 'unknown' in result['family']
         assert result['port'] == 1234
+    
+    def test_decode_truncated_ipv6_socket(self):
+        """Test decoding the 10-byte (truncated IPv6) socket layout"""
+        data = struct.pack('>8sH', bytes.fromhex('ff020000000000fb'), 5353)
+        result = decode_socket(data, 10)
+        assert result['family'] == 'IPv6'
+        assert result['address'] == 'ff02:0000:0000:00fb'
+        assert result['port'] == 5353
 
 
 class TestDecodeTTL:
@@ -266,6 +279,25 @@ class TestDecodeTTL:
         assert result == 64
 
 
+class TestDecodeMemoryview:
+    """Decoders accept memoryview slices as well as bytes"""
+
+    def test_decode_from_memoryview(self):
+        """Test decoding each type from a view into a larger buffer"""
+        buf = (b'\x00' + struct.pack('>d', 14.074e6) + struct.pack('>f', -3.5)
+               + struct.pack('>I', 0xDEADBEEF) + b'usb'
+               + struct.pack('>4sH', bytes([239, 1, 2, 3]), 5004))
+        mv = memoryview(buf)
+        assert decode_double(mv[1:9], 8) == pytest.approx(14.074e6)
+        assert decode_float(mv[9:13], 4) == pytest.approx(-3.5)
+        assert decode_int32(mv[13:17], 4) == 0xDEADBEEF
+        assert decode_int(mv[15:17], 2) == 0xBEEF
+        assert decode_bool(mv[16:17], 1) is True
+        assert decode_string(mv[17:20], 3) == 'usb'
+        assert decode_socket(mv[20:26], 6)['address'] == '239.1.2.3'
+        # Leading-zero-stripped float reassembled from a view
+        assert decode_float(mv[9:11], 2) == decode_float(buf[9:11], 2)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
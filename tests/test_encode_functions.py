@@ -173,6 +173,13 @@ class TestEncodeDouble:
         # Should maintain double precision
         assert abs(decoded - test_value) < 1e-9
 
+    def test_encode_subnormal_strips_leading_zeros(self):
+        """Values whose top byte is zero still get leading-zero compression"""
+        buf = bytearray()
+        encode_double(buf, StatusType.RADIO_FREQUENCY, 5e-324)  # smallest subnormal
+        assert buf[1] == 1
+        assert bytes(buf[2:]) == b'\x01'
+
 
 class TestEncodeString:
     """Tests for encode_string function"""
@@ -259,6 +266,35 @@ class TestEncodeEOL:
         assert len(buf) == 1
 
 
+class TestEncodeTag:
+    """Tests for the fixed-width command tag encoder"""
+    
+    def test_encode_tag_fixed_width(self):
+        """Tags are always 4 bytes, even when they have leading zeros"""
+        from ka9q.control import _encode_tag, decode_int32
+        buf = bytearray()
+        _encode_tag(buf, 0x42)
+        assert buf[0] == StatusType.COMMAND_TAG
+        assert buf[1] == 4
+        assert decode_int32(bytes(buf[2:]), buf[1]) == 0x42
+
+
+
+class TestPollCommand:
+    """Tests for the fixed-layout poll command"""
+    
+    def test_poll_command_layout(self):
+        """Poll is CMD, tag TLV, SSRC TLV, EOL with 4-byte values"""
+        from ka9q.control import _build_poll_command, CMD
+        buf = _build_poll_command(0x12345678, 0x42)
+        assert bytes(buf) == bytes([
+            CMD,
+            StatusType.COMMAND_TAG, 4, 0x00, 0x00, 0x00, 0x42,
+            StatusType.OUTPUT_SSRC, 4, 0x12, 0x34, 0x56, 0x78,
+            StatusType.EOL,
+        ])
+
+
 class TestEncodeDecodeRoundTrip:
     """Test that encode/decode operations are symmetric"""
     
@@ -8,9 +8,10 @@ Tests the discover_channels_native() function without requiring a live radiod.
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 import socket
 import struct
+import itertools
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,6 +21,20 @@ from ka9q.discovery import _decode_escape_sequences
 from ka9q.types import StatusType
 
 
+def feed_packets(mock_sock, packets, flags=0):
+    """Serve packets (or raise exceptions) from a mocked socket's recvmsg_into()"""
+    packets = iter(packets)
+    
+    def recvmsg_into(buffers, ancbufsize=0, msg_flags=0):
+        item = next(packets)
+        if isinstance(item, BaseException):
+            raise item
+        buffers[0][:len(item)] = item
+        return len(item), [], flags, ('239.1.2.3', 5006)
+    
+    mock_sock.recvmsg_into.side_effect = recvmsg_into
+
+
 class TestNativeDiscovery(unittest.TestCase):
     """Test native Python discovery implementation"""
     
@@ -96,10 +111,6 @@ class TestNativeDiscovery(unittest.TestCase):
         mock_socket = MagicMock()
         mock_create_socket.return_value = mock_socket
         
-        # Use real RadiodControl but intercept decode
-        from ka9q.control import RadiodControl
-        original_decode = RadiodControl._decode_status_response
-        
         # Create a mock status packet
         status_dict = {
             'ssrc': 14074000,
@@ -110,9 +121,9 @@ class TestNativeDiscovery(unittest.TestCase):
             'destination': {'address': '239.1.2.3', 'port': 5004}
         }
         
-        # Mock socket.recvfrom to return a status packet (type=0)
+        # Mock socket to return a status packet (type=0)
         mock_packet = b'\x00' + b'\x00' * 50  # Status packet (type 0)
-        mock_socket.recvfrom.return_value = (mock_packet, ('239.1.2.3', 5006))
+        feed_packets(mock_socket, itertools.repeat(mock_packet))
         
         # Mock select to return data once, then timeout
         call_count = [0]
@@ -127,12 +138,9 @@ class TestNativeDiscovery(unittest.TestCase):
         
         # Run discovery with short duration
         # Mock time to control loop - need enough values for all time.time() calls
-        time_values = [0.0, 0.1, 0.2, 1.0, 1.0, 1.0, 1.0]  # Enough for loop + logging
-        # Also mock _connect so the temporary RadiodControl built inside discovery
-        # doesn't try to resolve "test.local" via DNS.
-        with patch.object(RadiodControl, '_connect', return_value=None), \
-             patch.object(RadiodControl, '_decode_status_response', return_value=status_dict):
-            with patch('ka9q.discovery.time.time', side_effect=time_values):
+        time_values = [0.0, 0.1, 0.2, 1.0]  # start, then one reading per select() wakeup
+        with patch('ka9q.discovery.decode_status_tlv', return_value=status_dict):
+            with patch('ka9q.discovery.time.monotonic', side_effect=time_values):
                 channels = discover_channels_native("test.local", listen_duration=0.5)
         
         # Should find one channel
@@ -145,34 +153,167 @@ class TestNativeDiscovery(unittest.TestCase):
         self.assertEqual(channel.sample_rate, 12000)
         self.assertAlmostEqual(channel.snr, 12.5)
     
-    @patch('ka9q.control.RadiodControl')
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
+    @patch('ka9q.discovery.select.select')
+    def test_native_discovery_drains_queue_per_wakeup(self, mock_select, mock_create_socket, mock_resolve):
+        """All queued packets are read after one select() wakeup"""
+        mock_resolve.return_value = "239.1.2.3"
+        mock_socket = MagicMock()
+        mock_create_socket.return_value = mock_socket
+        
+        packet = b'\x00' + b'\x00' * 10
+        feed_packets(mock_socket, [packet] * 3 + [BlockingIOError()])
+        mock_select.side_effect = [([mock_socket], [], [])]
+        statuses = iter([{'ssrc': 1001}, {'ssrc': 1002}, {'ssrc': 1003}])
+        
+        with patch('ka9q.discovery.decode_status_tlv', side_effect=lambda buf: next(statuses)):
+            with patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 1.0]):
+                channels = discover_channels_native("test.local", listen_duration=0.5)
+        
+        self.assertEqual(set(channels), {1001, 1002, 1003})
+        self.assertEqual(mock_select.call_count, 1)
+        self.assertEqual(mock_socket.recvmsg_into.call_count, 4)
+    
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
     @patch('ka9q.discovery.select.select')
-    def test_native_discovery_skips_non_status_packets(self, mock_select, mock_control_class):
+    def test_native_discovery_stops_when_channel_set_is_stable(self, mock_select, mock_create_socket, mock_resolve):
+        """Listening ends stability_window after the last new SSRC"""
+        mock_resolve.return_value = "239.1.2.3"
+        mock_socket = MagicMock()
+        mock_create_socket.return_value = mock_socket
+        feed_packets(mock_socket, [b'\x00' * 10, BlockingIOError()] * 3)
+        mock_select.side_effect = [([mock_socket], [], [])] * 3
+        statuses = iter([{'ssrc': 1001}, {'ssrc': 1002}, {'ssrc': 1001}])
+        
+        with patch('ka9q.discovery.decode_status_tlv', side_effect=lambda buf: next(statuses)):
+            with patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 0.1, 0.3, 0.7]):
+                channels = discover_channels_native("test.local", listen_duration=2.0,
+                                                    stability_window=0.4)
+        
+        self.assertEqual(set(channels), {1001, 1002})
+        # Last new SSRC at 0.3 s: the final wait is capped at 0.3 + 0.4 - 0.3
+        self.assertEqual(mock_select.call_count, 3)
+        self.assertEqual(mock_select.call_args_list[0].args[3], 2.0)
+        self.assertAlmostEqual(mock_select.call_args_list[2].args[3], 0.4)
+    
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
+    @patch('ka9q.discovery.select.select')
+    def test_native_discovery_without_stability_window(self, mock_select, mock_create_socket, mock_resolve):
+        """stability_window=None listens for the full listen_duration"""
+        mock_resolve.return_value = "239.1.2.3"
+        mock_socket = MagicMock()
+        mock_create_socket.return_value = mock_socket
+        feed_packets(mock_socket, [b'\x00' * 10, BlockingIOError()])
+        mock_select.side_effect = [([mock_socket], [], []), ([], [], [])]
+        
+        with patch('ka9q.discovery.decode_status_tlv', return_value={'ssrc': 1001}):
+            with patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 0.1, 2.0]):
+                channels = discover_channels_native("test.local", listen_duration=2.0,
+                                                    stability_window=None)
+        
+        self.assertEqual(set(channels), {1001})
+        self.assertAlmostEqual(mock_select.call_args_list[1].args[3], 1.9)
+    
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
+    @patch('ka9q.discovery.select.select')
+    def test_native_discovery_skips_truncated_packets(self, mock_select, mock_create_socket, mock_resolve):
+        """Packets flagged MSG_TRUNC are not decoded"""
+        mock_resolve.return_value = "239.1.2.3"
+        mock_socket = MagicMock()
+        mock_create_socket.return_value = mock_socket
+        feed_packets(mock_socket, [b'\x00' * 10, BlockingIOError()], flags=socket.MSG_TRUNC)
+        mock_select.side_effect = [([mock_socket], [], [])]
+        
+        with patch('ka9q.discovery.decode_status_tlv') as mock_decode, \
+             patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 1.0]):
+            channels = discover_channels_native("test.local", listen_duration=0.5)
+        
+        self.assertEqual(channels, {})
+        mock_decode.assert_not_called()
+    
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
+    @patch('ka9q.discovery.select.select')
+    def test_native_discovery_updates_volatile_fields_in_place(self, mock_select, mock_create_socket, mock_resolve):
+        """Per-packet S/N and timing changes update the existing ChannelInfo in place"""
+        mock_resolve.return_value = "239.1.2.3"
+        mock_socket = MagicMock()
+        mock_create_socket.return_value = mock_socket
+        feed_packets(mock_socket, [b'\x00' * 10] * 4 + [BlockingIOError()])
+        mock_select.side_effect = [([mock_socket], [], [])]
+        statuses = iter([
+            {'ssrc': 1001, 'frequency': 7.074e6, 'snr': 10.0, 'gps_time': 100, 'rtp_timesnap': 1},
+            {'ssrc': 1001, 'frequency': 7.074e6, 'snr': 10.5, 'gps_time': 200, 'rtp_timesnap': 2},
+            {'ssrc': 1001, 'frequency': 7.074e6, 'snr': 11.0, 'gps_time': 300, 'rtp_timesnap': 3},
+            {'ssrc': 1002, 'frequency': 14.074e6, 'snr': 5.0, 'gps_time': 300, 'rtp_timesnap': 3},
+        ])
+        
+        with patch('ka9q.discovery.decode_status_tlv', side_effect=lambda buf: next(statuses)), \
+             patch('ka9q.discovery.ChannelInfo', wraps=ChannelInfo) as mock_info, \
+             patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 1.0]):
+            channels = discover_channels_native("test.local", listen_duration=0.5)
+        
+        self.assertEqual(mock_info.call_count, 2)
+        self.assertEqual(channels[1001].snr, 11.0)
+        self.assertEqual(channels[1001].gps_time, 300)
+        self.assertEqual(channels[1001].rtp_timesnap, 3)
+    
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
+    @patch('ka9q.discovery.select.select')
+    def test_native_discovery_rebuilds_retuned_channel(self, mock_select, mock_create_socket, mock_resolve):
+        """A frequency change for a known SSRC replaces its ChannelInfo"""
+        mock_resolve.return_value = "239.1.2.3"
+        mock_socket = MagicMock()
+        mock_create_socket.return_value = mock_socket
+        feed_packets(mock_socket, [b'\x00' * 10] * 2 + [BlockingIOError()])
+        mock_select.side_effect = [([mock_socket], [], [])]
+        statuses = iter([
+            {'ssrc': 1001, 'frequency': 7.074e6, 'snr': 10.0},
+            {'ssrc': 1001, 'frequency': 10.136e6, 'snr': 10.0},
+        ])
+        
+        with patch('ka9q.discovery.decode_status_tlv', side_effect=lambda buf: next(statuses)), \
+             patch('ka9q.discovery.ChannelInfo', wraps=ChannelInfo) as mock_info, \
+             patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 1.0]):
+            channels = discover_channels_native("test.local", listen_duration=0.5)
+        
+        self.assertEqual(mock_info.call_count, 2)
+        self.assertEqual(channels[1001].frequency, 10.136e6)
+    
+    @patch('ka9q.discovery.resolve_multicast_address')
+    @patch('ka9q.discovery._create_status_listener_socket')
+    @patch('ka9q.discovery.select.select')
+    def test_native_discovery_skips_non_status_packets(self, mock_select, mock_create_socket, mock_resolve):
         """Test that non-status packets are skipped"""
-        # Mock RadiodControl instance
-        mock_control = MagicMock()
-        mock_control_class.return_value = mock_control
+        mock_resolve.return_value = "239.1.2.3"
         
         # Mock socket
         mock_socket = MagicMock()
-        mock_control._setup_status_listener.return_value = mock_socket
+        mock_create_socket.return_value = mock_socket
         
-        # Mock socket.recvfrom to return command packets (type=1)
+        # Mock socket to return command packets (type=1)
         mock_packet = b'\x01' + b'\x00' * 50  # Command packet (type 1), not status
-        mock_socket.recvfrom.return_value = (mock_packet, ('239.1.2.3', 5006))
+        feed_packets(mock_socket, [mock_packet, mock_packet, BlockingIOError()])
         
         # Mock select to return data once
-        mock_select.return_value = ([mock_socket], [], [])
+        mock_select.side_effect = [([mock_socket], [], [])]
         
         # Run discovery with very short duration
-        with patch('ka9q.discovery.time.time', side_effect=[0, 1.0]):
+        with patch('ka9q.discovery.decode_status_tlv') as mock_decode, \
+             patch('ka9q.discovery.time.monotonic', side_effect=[0.0, 1.0]):
             channels = discover_channels_native("test.local", listen_duration=0.1)
         
         # Should find no channels (packet skipped)
         self.assertEqual(len(channels), 0)
         
         # Verify decode was never called (packet was skipped)
-        mock_control._decode_status_response.assert_not_called()
+        mock_decode.assert_not_called()
+        self.assertEqual(mock_socket.recvmsg_into.call_count, 3)
     
     @patch('ka9q.discovery.discover_channels_native')
     @patch('ka9q.discovery.discover_channels_via_control')
@@ -215,6 +356,103 @@ class TestNativeDiscovery(unittest.TestCase):
         # Should return native results
         self.assertEqual(len(channels), 1)
     
+    @patch('ka9q.discovery.subprocess.run')
+    def test_via_control_parses_listing(self, mock_run):
+        """Test parsing of the control utility's channel listing"""
+        mock_run.return_value = Mock(stdout=(
+            "   SSRC    preset   samprate      freq, Hz   SNR output channel\n"
+            "  60000        iq     16,000        60,000   9.5 239.41.204.101:5004\n"
+            "14074000      usb     12,000    14,074,000  -inf 239.41.204.102\n"
+            "  10000        am     12,000        10,000   3.0 239.41.204.103:abc\n"
+            "garbage line\n"
+            "2 channels\n"
+        ))
+        
+        from ka9q import discover_channels_via_control
+        channels = discover_channels_via_control("test.local")
+        
+        self.assertEqual(sorted(channels), [60000, 14074000])
+        iq = channels[60000]
+        self.assertEqual(iq.preset, 'iq')
+        self.assertEqual(iq.sample_rate, 16000)
+        self.assertEqual(iq.frequency, 60000.0)
+        self.assertEqual(iq.snr, 9.5)
+        self.assertEqual((iq.multicast_address, iq.port), ('239.41.204.101', 5004))
+        usb = channels[14074000]
+        self.assertEqual(usb.frequency, 14.074e6)
+        self.assertEqual(usb.snr, float('-inf'))
+        self.assertEqual((usb.multicast_address, usb.port), ('239.41.204.102', 5004))
+    
+    @patch('ka9q.discovery.discover_channels')
+    def test_find_channels_by_frequencies_matches_linear_scan(self, mock_discover):
+        """Test that bisect matching agrees with a brute-force nearest search"""
+        import random
+        from ka9q.discovery import find_channels_by_frequencies
+        
+        rng = random.Random(1)
+        channels = {}
+        for ssrc in range(200):
+            freq = rng.choice([rng.randrange(1000, 30000) * 1000.0, 14.074e6])
+            channels[ssrc] = ChannelInfo(ssrc, 'usb', 12000, freq, 0.0, '239.1.2.3', 5004)
+        mock_discover.return_value = channels
+        targets = [rng.uniform(0.5e6, 31e6) for _ in range(100)] + [14.074e6, 14.0745e6]
+        
+        matched = find_channels_by_frequencies("test.local", targets, tolerance=2000.0)
+        
+        for target in targets:
+            best = None
+            for ch in channels.values():
+                diff = abs(ch.frequency - target)
+                if diff < 2000.0 and (best is None or diff < abs(best.frequency - target)):
+                    best = ch
+            self.assertIs(matched.get(target), best)
+    
+    @patch('ka9q.discovery.socket.socket')
+    def test_listener_socket_options(self, mock_socket_class):
+        """Test that the status listener filters foreign groups and enlarges its buffer"""
+        from ka9q import discovery
+        
+        mock_sock = mock_socket_class.return_value
+        with patch.object(discovery, '_IP_MULTICAST_ALL', 49):
+            discovery._create_status_listener_socket('239.1.2.3')
+        
+        calls = mock_sock.setsockopt.call_args_list
+        self.assertIn(call(socket.IPPROTO_IP, 49, 0), calls)
+        self.assertIn(call(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                                         discovery._STATUS_RCVBUF), calls)
+        self.assertIn(call(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP,
+                           socket.inet_aton('239.1.2.3') + bytes(4)), calls)
+        mock_sock.setblocking.assert_called_once_with(False)
+    
+    @patch('ka9q.discovery.subprocess.run')
+    def test_radiod_services_from_avahi_cache(self, mock_run):
+        """Test that a populated avahi cache avoids a network browse"""
+        from ka9q import discover_radiod_services
+        mock_run.return_value = Mock(stdout=(
+            "+;lo;IPv4;bee1\\032hf;_ka9q-ctl._udp;local\n"
+            "=;lo;IPv4;bee1\\032hf;_ka9q-ctl._udp;local;bee1.local;239.1.2.3;5006;\n"
+        ))
+        
+        services = discover_radiod_services()
+        
+        self.assertEqual(services, [{'name': 'bee1 hf', 'address': '239.1.2.3'}])
+        mock_run.assert_called_once()
+        self.assertEqual(mock_run.call_args.args[0][1], '-c')
+    
+    @patch('ka9q.discovery.subprocess.run')
+    def test_radiod_services_browse_when_cache_empty(self, mock_run):
+        """Test fallback to a terminating browse when the cache is empty"""
+        from ka9q import discover_radiod_services
+        mock_run.side_effect = [
+            Mock(stdout=""),
+            Mock(stdout="=;eth0;IPv4;hf;_ka9q-ctl._udp;local;hf.local;239.1.2.4;5006;\n"),
+        ]
+        
+        services = discover_radiod_services()
+        
+        self.assertEqual(services, [{'name': 'hf', 'address': '239.1.2.4'}])
+        self.assertEqual([c.args[0][1] for c in mock_run.call_args_list], ['-c', '-t'])
+    
     @patch('ka9q.discovery.discover_channels_via_control')
     def test_discover_channels_force_control(self, mock_control):
         """Test forcing control utility (skipping native)"""
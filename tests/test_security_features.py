@@ -22,29 +22,16 @@ from ka9q.control import (
 from ka9q.exceptions import ValidationError
 
 
-class TestCryptographicRandomness:
-    """Test that command tags use cryptographically secure random"""
+class TestCommandTags:
+    """Test command tag generation"""
     
-    def test_command_tags_are_unpredictable(self):
-        """Command tags should be cryptographically random"""
-        # Create mock control (don't actually connect)
-        control = RadiodControl.__new__(RadiodControl)
-        control.status_address = "test.local"
-        control.socket = None
-        
-        # Generate multiple command buffers and check tags are different
-        # This is a weak test, but at least verifies tags aren't sequential
-        from ka9q.control import encode_int, StatusType, CMD, secrets
+    def test_command_tags_are_unique(self):
+        """Successive command tags must not repeat and must fit in 31 bits"""
+        from ka9q.control import next_command_tag
         
-        tags = []
-        for _ in range(10):
-            tag = secrets.randbits(31)
-            tags.append(tag)
+        tags = [next_command_tag() for _ in range(1000)]
         
-        # All tags should be different (extremely unlikely to have duplicates)
         assert len(set(tags)) == len(tags), "Command tags should not repeat"
-        
-        # Tags should be in valid range
         for tag in tags:
             assert 0 <= tag < 2**31
 
@@ -92,6 +79,35 @@ class TestInputValidation:
         with pytest.raises(ValidationError, match="Invalid frequency"):
             _validate_frequency(1e15)  # Too high
     
+    def test_ssrc_frequency_validation(self):
+        """Combined fast path accepts what the separate validators accept"""
+        from ka9q.control import _validate_ssrc_frequency
+        _validate_ssrc_frequency(12345678, 14.074e6)
+        _validate_ssrc_frequency(0xFFFFFFFF, 7000000)
+        
+        # Failures fall back to the individual validators' messages
+        with pytest.raises(ValidationError, match="Invalid SSRC"):
+            _validate_ssrc_frequency(-1, 14.074e6)
+        with pytest.raises(ValidationError, match="must be a number"):
+            _validate_ssrc_frequency(1, "14.074")
+        with pytest.raises(ValidationError, match="Invalid frequency"):
+            _validate_ssrc_frequency(1, 0.0)
+    
+    def test_channel_request_validation(self):
+        """create_channel's combined validator keeps the per-field errors and their order"""
+        from ka9q.control import _validate_channel_request
+        _validate_channel_request(12345678, 14.074e6, 12000, 0.0)
+        _validate_channel_request(1, 7000000, None, -20)
+        
+        with pytest.raises(ValidationError, match="Invalid SSRC"):
+            _validate_channel_request(-1, 0.0, 0, 1000.0)
+        with pytest.raises(ValidationError, match="Invalid frequency"):
+            _validate_channel_request(1, 0.0, 0, 1000.0)
+        with pytest.raises(ValidationError, match="Sample rate must be an integer"):
+            _validate_channel_request(1, 14.074e6, 12000.0, 0.0)
+        with pytest.raises(ValidationError, match="Invalid gain"):
+            _validate_channel_request(1, 14.074e6, 12000, float('nan'))
+    
     def test_preset_validation(self):
         """Test preset name validation"""
         # Valid presets
@@ -204,34 +220,90 @@ class TestRateLimiting:
         # Create control with very low limit for testing
         control = RadiodControl.__new__(RadiodControl)
         control.max_commands_per_sec = 5
-        control._command_count = 0
-        control._command_window_start = time.time()
         control._rate_limit_lock = __import__('threading').Lock()
         
-        # Send commands up to limit
+        # A full bucket allows a burst up to the limit without sleeping
+        start = time.monotonic()
         for i in range(5):
             control._check_rate_limit()
-            assert control._command_count == i + 1
+        assert time.monotonic() - start < 0.1
+        assert control._tokens < 1
         
-        # Next command should cause sleep
-        start = time.time()
+        # Next command must wait for one token to refill (1/rate seconds)
+        start = time.monotonic()
         control._check_rate_limit()
-        elapsed = time.time() - start
+        elapsed = time.monotonic() - start
         
-        # Should have slept for roughly 1 second
-        assert elapsed >= 0.9  # Allow some tolerance
+        assert elapsed >= 0.15  # Allow some tolerance around 0.2s
     
-    def test_rate_limit_window_reset(self):
-        """Rate limiter should reset window after 1 second"""
+    def test_rate_limit_refill(self):
+        """Rate limiter should refill tokens over time"""
         control = RadiodControl.__new__(RadiodControl)
         control.max_commands_per_sec = 10
-        control._command_count = 5
-        control._command_window_start = time.time() - 1.1  # 1.1 seconds ago
         control._rate_limit_lock = __import__('threading').Lock()
+        control._tokens = 0.0
+        control._last_refill_ns = time.monotonic_ns() - 1_100_000_000  # 1.1 seconds ago
         
-        # Should reset the window
+        # Bucket refills (capped at the limit) and one token is taken
+        start = time.monotonic()
         control._check_rate_limit()
-        assert control._command_count == 1  # Reset and incremented
+        assert time.monotonic() - start < 0.1
+        assert control._tokens == pytest.approx(9.0)
+
+
+class TestSendCommandLocking:
+    """Test send_command lock scope"""
+
+    def test_backoff_sleep_does_not_hold_socket_lock(self):
+        """Other senders must not be blocked while one is backing off"""
+        import threading
+        from unittest.mock import MagicMock, patch
+
+        control = RadiodControl.__new__(RadiodControl)
+        control.socket = MagicMock()
+        control.socket.send.side_effect = [OSError("transient"), 3]
+        control.dest_addr = ("239.1.2.3", 5006)
+        control._socket_lock = threading.Lock()
+        control.max_commands_per_sec = 100
+        control._rate_limit_lock = threading.Lock()
+        control.metrics = Metrics()
+
+        lock_free_during_sleep = []
+
+        def fake_sleep(_delay):
+            acquired = control._socket_lock.acquire(blocking=False)
+            lock_free_during_sleep.append(acquired)
+            if acquired:
+                control._socket_lock.release()
+
+        with patch('time.sleep', side_effect=fake_sleep):
+            assert control.send_command(bytearray(b'\x01\x00')) == 3
+
+        assert lock_free_during_sleep == [True]
+        assert control.metrics.commands_sent == 1
+
+    def test_close_aborts_retry_backoff(self):
+        """A sender waiting to retry gives up as soon as the control is closed"""
+        import threading
+        from unittest.mock import MagicMock
+        from ka9q.exceptions import CommandError
+
+        control = RadiodControl.__new__(RadiodControl)
+        control.socket = MagicMock()
+        control.socket.send.side_effect = OSError("down")
+        control.dest_addr = ("239.1.2.3", 5006)
+        control._socket_lock = threading.Lock()
+        control._shutdown_event = threading.Event()
+        control.max_commands_per_sec = 100
+        control._rate_limit_lock = threading.Lock()
+        control.metrics = Metrics()
+        control._shutdown_event.set()
+
+        start = time.monotonic()
+        with pytest.raises(CommandError, match="aborted"):
+            control.send_command(bytearray(b'\x01\x00'), retry_delay=5.0)
+        assert time.monotonic() - start < 1.0
+        assert control.socket.send.call_count == 1
 
 
 class TestMetrics:
@@ -159,3 +159,14 @@ def test_field_accessors_and_snr():
     assert st.snr_per_hz == pytest.approx(130.0)
     # S/N ≈ baseband - (noise_density + 10log10(3000)) ≈ -40 - (-170 + 34.77) ≈ 95.2
     assert st.snr == pytest.approx(95.23, abs=0.1)
+
+
+def test_snr_matches_flat_decoder():
+    from ka9q.control import decode_status_tlv
+    pkt = _build_packet(
+        ("float", StatusType.LOW_EDGE, 100.0),
+        ("float", StatusType.HIGH_EDGE, 2800.0),
+        ("float", StatusType.BASEBAND_POWER, -101.0),
+        ("float", StatusType.NOISE_DENSITY, -136.0),
+    )
+    assert decode_status_packet(pkt).snr == decode_status_tlv(pkt)['snr']
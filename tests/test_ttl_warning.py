@@ -23,7 +23,7 @@ class TestTTLWarning:
         data = bytes([0, StatusType.OUTPUT_TTL, 1, 0])
         
         # We need to capture logs from ka9q.control
-        with caplog.at_level(logging.DEBUG, logger="ka9q.control"):
+        with caplog.at_level(logging.DEBUG, logger="ka9q._status_decoder"):
             status = control._decode_status_response(data)
             
         # Debug: print captured logs if failure
@@ -42,7 +42,7 @@ class TestTTLWarning:
         data = bytes([0, StatusType.OUTPUT_TTL, 1, 2])
         
         caplog.clear()
-        with caplog.at_level(logging.WARNING, logger="ka9q.control"):
+        with caplog.at_level(logging.WARNING, logger="ka9q._status_decoder"):
             status = control._decode_status_response(data)
             
         assert status['ttl'] == 2
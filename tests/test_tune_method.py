@@ -8,14 +8,30 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import time
+import itertools
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from ka9q.control import RadiodControl, encode_int, encode_double, encode_string
+from ka9q.exceptions import ValidationError
 from ka9q.types import StatusType, Encoding
 
 
+def feed_packets(mock_sock, packets):
+    """Serve packets (or raise exceptions) from a mocked socket's recvfrom_into()"""
+    packets = iter(packets)
+    
+    def recvfrom_into(buf, nbytes=0):
+        item = next(packets)
+        if isinstance(item, BaseException):
+            raise item
+        buf[:len(item)] = item
+        return len(item), ('239.1.2.3', 5006)
+    
+    mock_sock.recvfrom_into.side_effect = recvfrom_into
+
+
 class TestTuneMethod:
     """Tests for RadiodControl.tune() method"""
     
@@ -79,10 +95,10 @@ class TestTuneMethod:
         
         # Mock the socket operations
         mock_sock = MagicMock()
-        mock_sock.recvfrom.return_value = (response, ('239.1.2.3', 5006))
+        feed_packets(mock_sock, itertools.repeat(response))
         
         with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock):
-            with patch('ka9q.control.secrets.randbits', return_value=command_tag):
+            with patch('ka9q.control.next_command_tag', return_value=command_tag):
                 with patch('select.select', return_value=([mock_sock], [], [])):
                     status = mock_control.tune(
                         ssrc=ssrc,
@@ -103,13 +119,80 @@ class TestTuneMethod:
         
         # Mock socket that never receives data
         mock_sock = MagicMock()
-        mock_sock.recvfrom.side_effect = socket.timeout()
+        feed_packets(mock_sock, itertools.repeat(socket.timeout()))
         
         with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock):
             with patch('select.select', return_value=([], [], [])):
                 with pytest.raises(TimeoutError, match="No status response"):
                     mock_control.tune(ssrc=ssrc, timeout=0.5)
     
+    def test_tune_select_waits_for_retry_timer(self, mock_control):
+        """select() sleeps until the next retry instead of a short fixed poll"""
+        ssrc = 14074000
+        command_tag = 12345
+        response = self.create_status_response(ssrc=ssrc, command_tag=command_tag, frequency=14.074e6)
+        
+        mock_sock = MagicMock()
+        feed_packets(mock_sock, itertools.repeat(response))
+        waits = []
+        
+        def fake_select(rlist, wlist, xlist, wait):
+            waits.append(wait)
+            return ([mock_sock], [], []) if len(waits) > 1 else ([], [], [])
+        
+        with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock), \
+             patch.object(mock_control, 'send_command') as mock_send, \
+             patch('ka9q.control.next_command_tag', return_value=command_tag), \
+             patch('select.select', side_effect=fake_select):
+            status = mock_control.tune(ssrc=ssrc, timeout=5.0)
+        
+        assert status['ssrc'] == ssrc
+        # First wait runs to the 200ms retry timer, not the deadline
+        assert waits[0] == pytest.approx(0.2, abs=0.01)
+        assert mock_send.call_count == 1
+    
+    def test_tune_drains_burst_per_wakeup(self, mock_control):
+        """Queued packets are read until BlockingIOError before select() runs again"""
+        ssrc = 14074000
+        command_tag = 12345
+        other = self.create_status_response(ssrc=555, command_tag=1, frequency=1.0e6)
+        match = self.create_status_response(ssrc=ssrc, command_tag=command_tag, frequency=14.074e6)
+        
+        mock_sock = MagicMock()
+        feed_packets(mock_sock, [
+            other,
+            other,
+            BlockingIOError(),
+            other,
+            match,
+        ])
+        
+        with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock), \
+             patch.object(mock_control, 'send_command'), \
+             patch('ka9q.control.next_command_tag', return_value=command_tag), \
+             patch('select.select', return_value=([mock_sock], [], [])) as mock_select:
+            status = mock_control.tune(ssrc=ssrc, timeout=1.0)
+        
+        assert status['ssrc'] == ssrc
+        assert mock_select.call_count == 2
+        assert mock_sock.recvfrom_into.call_count == 5
+        # Rejected packets still count as received status
+        assert mock_control.metrics.status_received == 4
+    
+    def test_peek_ssrc_tag(self):
+        """The fast pre-check reads the (ssrc, tag) a full decode would"""
+        from ka9q.control import _peek_ssrc_tag
+        packet = self.create_status_response(ssrc=14074000, command_tag=12345, frequency=14.074e6)
+        assert _peek_ssrc_tag(packet) == (14074000, 12345)
+        # Tag missing entirely
+        no_tag = bytearray([0])
+        encode_int(no_tag, StatusType.OUTPUT_SSRC, 14074000)
+        no_tag.append(StatusType.EOL)
+        assert _peek_ssrc_tag(bytes(no_tag)) is None
+        # Command packets never match
+        assert _peek_ssrc_tag(b'\x01' + packet[1:]) is None
+        assert _peek_ssrc_tag(b'') is None
+    
     def test_tune_wrong_ssrc_ignored(self, mock_control):
         """Test that responses with wrong SSRC are ignored"""
         ssrc = 14074000
@@ -132,13 +215,13 @@ class TestTuneMethod:
         
         mock_sock = MagicMock()
         # Return wrong response first, then correct one
-        mock_sock.recvfrom.side_effect = [
-            (wrong_response, ('239.1.2.3', 5006)),
-            (correct_response, ('239.1.2.3', 5006))
-        ]
+        feed_packets(mock_sock, [
+            wrong_response,
+            correct_response
+        ])
         
         with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock):
-            with patch('ka9q.control.secrets.randbits', return_value=command_tag):
+            with patch('ka9q.control.next_command_tag', return_value=command_tag):
                 with patch('select.select', return_value=([mock_sock], [], [])):
                     status = mock_control.tune(ssrc=ssrc, timeout=1.0)
         
@@ -166,10 +249,10 @@ class TestTuneMethod:
         )
         
         mock_sock = MagicMock()
-        mock_sock.recvfrom.return_value = (response, ('239.1.2.3', 5006))
+        feed_packets(mock_sock, itertools.repeat(response))
         
         with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock):
-            with patch('ka9q.control.secrets.randbits', return_value=command_tag):
+            with patch('ka9q.control.next_command_tag', return_value=command_tag):
                 with patch('select.select', return_value=([mock_sock], [], [])):
                     status = mock_control.tune(ssrc=ssrc, gain=gain, timeout=0.5)
         
@@ -201,10 +284,10 @@ class TestTuneMethod:
         )
         
         mock_sock = MagicMock()
-        mock_sock.recvfrom.return_value = (response, ('239.1.2.3', 5006))
+        feed_packets(mock_sock, itertools.repeat(response))
         
         with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock):
-            with patch('ka9q.control.secrets.randbits', return_value=command_tag):
+            with patch('ka9q.control.next_command_tag', return_value=command_tag):
                 with patch('select.select', return_value=([mock_sock], [], [])):
                     status = mock_control.tune(
                         ssrc=ssrc,
@@ -224,6 +307,126 @@ class TestTuneMethod:
         assert abs(status['frequency'] - frequency) < 1.0
 
 
+def status_response(ssrc, command_tag, frequency):
+    """Build a minimal status packet answering one command"""
+    buf = bytearray()
+    buf.append(0)  # Status packet type
+    encode_int(buf, StatusType.OUTPUT_SSRC, ssrc)
+    encode_int(buf, StatusType.COMMAND_TAG, command_tag)
+    encode_double(buf, StatusType.RADIO_FREQUENCY, frequency)
+    buf.append(StatusType.EOL)
+    return bytes(buf)
+
+
+class TestTuneMany:
+    """Tests for tune_many()"""
+
+    def test_collects_all_responses(self, mock_control):
+        """Every request is answered from one drained burst, regardless of order"""
+        from ka9q import control
+        mock_sock = MagicMock()
+        feed_packets(mock_sock, [
+            # Unrelated channel, then the two answers out of order
+            status_response(555, 999, 1.0e6),
+            status_response(1002, 222, 14.074e6),
+            status_response(1001, 111, 7.074e6),
+        ])
+
+        with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock), \
+             patch.object(mock_control, 'send_command') as mock_send, \
+             patch('ka9q.control.next_command_tag', side_effect=[111, 222]), \
+             patch('ka9q.control.decode_status_tlv', wraps=control.decode_status_tlv) as decode, \
+             patch('select.select', return_value=([mock_sock], [], [])) as mock_select:
+            results = mock_control.tune_many([
+                {'ssrc': 1001, 'frequency_hz': 7.074e6},
+                {'ssrc': 1002, 'frequency_hz': 14.074e6, 'preset': 'usb'},
+            ], timeout=1.0)
+
+        assert set(results) == {1001, 1002}
+        assert results[1001]['frequency'] == pytest.approx(7.074e6)
+        assert results[1002]['frequency'] == pytest.approx(14.074e6)
+        # Both commands went out in the first send round
+        assert mock_send.call_count == 2
+        # One wakeup; the other channel's packet was never fully decoded
+        assert mock_select.call_count == 1
+        assert decode.call_count == 2
+        assert mock_control.metrics.status_received == 3
+
+    def test_missing_response_is_absent(self, mock_control):
+        """Unanswered SSRCs are left out, and only they are re-sent"""
+        mock_sock = MagicMock()
+        feed_packets(mock_sock, [status_response(1001, 111, 7.074e6), BlockingIOError()])
+        ready = iter([([mock_sock], [], [])])
+
+        with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock), \
+             patch.object(mock_control, 'send_command') as mock_send, \
+             patch('ka9q.control.next_command_tag', side_effect=[111, 222]), \
+             patch('select.select', side_effect=lambda *a: next(ready, ([], [], []))):
+            results = mock_control.tune_many([
+                {'ssrc': 1001, 'frequency_hz': 7.074e6},
+                {'ssrc': 1002, 'frequency_hz': 14.074e6},
+            ], timeout=0.3)
+
+        assert list(results) == [1001]
+        first_round = [c.args[0] for c in mock_send.call_args_list[:2]]
+        resent = [c.args[0] for c in mock_send.call_args_list[2:]]
+        assert resent and all(cmd == first_round[1] for cmd in resent)
+
+    def test_deadline_uses_monotonic_clock(self, mock_control):
+        """A wall-clock step neither ends nor extends the wait"""
+        mock_sock = MagicMock()
+        clock = iter([100.0, 100.5, 101.5])
+
+        with patch.object(mock_control, '_setup_status_listener', return_value=mock_sock), \
+             patch.object(mock_control, 'send_command'), \
+             patch('ka9q.control.time.monotonic', side_effect=lambda: next(clock)), \
+             patch('ka9q.control.time.time', return_value=1e12), \
+             patch('select.select', return_value=([], [], [])) as mock_select:
+            assert mock_control.tune_many([{'ssrc': 1001}], timeout=1.0) == {}
+
+        assert mock_select.call_count == 2
+
+    def test_empty_batch(self, mock_control):
+        """An empty request list returns immediately"""
+        with patch.object(mock_control, 'send_command') as mock_send:
+            assert mock_control.tune_many([]) == {}
+        mock_send.assert_not_called()
+
+    def test_duplicate_ssrc_rejected(self, mock_control):
+        """The same SSRC may not appear twice in one batch"""
+        with patch.object(mock_control, 'send_command') as mock_send:
+            with pytest.raises(ValidationError, match="Duplicate SSRC"):
+                mock_control.tune_many([{'ssrc': 1}, {'ssrc': 1}])
+        mock_send.assert_not_called()
+
+    def test_missing_ssrc_rejected(self, mock_control):
+        """Each request must name its SSRC"""
+        with pytest.raises(ValidationError, match="missing 'ssrc'"):
+            mock_control.tune_many([{'frequency_hz': 7.074e6}])
+
+    def test_invalid_request_sends_nothing(self, mock_control):
+        """A bad request fails the batch before any command is sent"""
+        with patch.object(mock_control, 'send_command') as mock_send:
+            with pytest.raises(ValidationError):
+                mock_control.tune_many([
+                    {'ssrc': 1001, 'frequency_hz': 7.074e6},
+                    {'ssrc': 1002, 'frequency_hz': -1.0},
+                ])
+        mock_send.assert_not_called()
+
+    def test_unknown_parameter_rejected(self, mock_control):
+        """A misspelled tune() keyword raises ValidationError before any side effect"""
+        with patch.object(mock_control, 'send_command') as mock_send, \
+             patch.object(mock_control, '_forget_cached_channel') as mock_forget:
+            with pytest.raises(ValidationError, match="frequncy_hz"):
+                mock_control.tune_many([
+                    {'ssrc': 1001, 'frequency_hz': 7.074e6},
+                    {'ssrc': 1002, 'frequncy_hz': 7e6},
+                ])
+        mock_send.assert_not_called()
+        mock_forget.assert_not_called()
+
+
 class TestDecodeStatusResponse:
     """Tests for _decode_status_response method"""
     
@@ -292,6 +495,23 @@ class TestDecodeStatusResponse:
         # SNR should be positive for these values
         assert status['snr'] > 0
     
+    def test_snr_matches_linear_formula(self):
+        """_snr_db agrees with the (S+N)/N - 1 linear-domain definition"""
+        import math
+        from ka9q._status_decoder import _snr_db
+        for power, density, bw in [(-10.0, -140.0, 3000.0), (-100.0, -135.0, 2800.0), (3.0, -60.0, 12000.0)]:
+            noise_db = density + 10 * math.log10(bw)
+            expected = 10 * math.log10(10 ** (power / 10) / 10 ** (noise_db / 10) - 1)
+            assert _snr_db(power, density, -bw / 2, bw / 2) == pytest.approx(expected, abs=1e-9)
+    
+    def test_snr_edge_cases(self):
+        """No SNR for an empty filter or a signal at/below the noise; no overflow far above it"""
+        from ka9q._status_decoder import _snr_db
+        assert _snr_db(-10.0, -140.0, 1000.0, 1000.0) is None
+        assert _snr_db(-105.0, -140.0, 0.0, 3162.2776601683795) is None
+        assert _snr_db(-120.0, -140.0, 0.0, 3000.0) is None
+        assert _snr_db(5000.0, -5000.0, 0.0, 1.0) == pytest.approx(10000.0)
+    
     def test_decode_all_fields(self, mock_control):
         """Test decoding all supported status fields"""
         buffer = bytearray()
@@ -338,6 +558,71 @@ class TestDecodeStatusResponse:
         assert status['encoding'] == Encoding.S16LE
         assert 'snr' in status  # Should be calculated
 
+    def test_module_level_decoder_matches_method(self, mock_control):
+        """The module-level decoder needs no instance and only the method counts metrics"""
+        from ka9q.control import decode_status_tlv
+        buffer = bytearray()
+        buffer.append(0)  # Status packet
+        encode_int(buffer, StatusType.OUTPUT_SSRC, 14074000)
+        encode_double(buffer, StatusType.RADIO_FREQUENCY, 14.074e6)
+        buffer.append(StatusType.EOL)
+
+        before = mock_control.metrics.status_received
+        assert decode_status_tlv(bytes(buffer)) == mock_control._decode_status_response(bytes(buffer))
+        assert mock_control.metrics.status_received == before + 1
+
+    def test_full_width_and_stripped_fields_agree(self):
+        """Fields read in place at full width match the leading-zero-stripped path"""
+        from ka9q.control import decode_status_tlv
+        full = bytearray([0])
+        full += bytes([StatusType.OUTPUT_SSRC, 4]) + struct.pack('>I', 0x1234)
+        full += bytes([StatusType.GAIN, 4]) + struct.pack('>f', 0.0)
+        full += bytes([StatusType.RADIO_FREQUENCY, 8]) + struct.pack('>d', 10e6)
+        full.append(StatusType.EOL)
+
+        stripped = bytearray([0])
+        encode_int(stripped, StatusType.OUTPUT_SSRC, 0x1234)
+        stripped += bytes([StatusType.GAIN, 0])
+        encode_double(stripped, StatusType.RADIO_FREQUENCY, 10e6)
+        stripped.append(StatusType.EOL)
+
+        expected = {'ssrc': 0x1234, 'gain': 0.0, 'frequency': 10e6}
+        assert decode_status_tlv(bytes(full)) == expected
+        assert decode_status_tlv(bytes(stripped)) == expected
+
+    def test_decode_from_reused_receive_buffer(self):
+        """Results decoded from a view survive the receive buffer being overwritten"""
+        from ka9q.control import decode_status_tlv
+        packet = bytearray([0])
+        encode_int(packet, StatusType.OUTPUT_SSRC, 1001)
+        encode_string(packet, StatusType.PRESET, 'usb')
+        packet += bytes([StatusType.OUTPUT_DATA_DEST_SOCKET, 6, 239, 1, 2, 3, 0x13, 0x8c])
+        packet.append(StatusType.EOL)
+
+        rxbuf = bytearray(8192)
+        rxbuf[:len(packet)] = packet
+        status = decode_status_tlv(memoryview(rxbuf)[:len(packet)])
+        rxbuf[:] = bytes(len(rxbuf))
+
+        assert status == {'ssrc': 1001, 'preset': 'usb',
+                          'destination': {'family': 'IPv4', 'address': '239.1.2.3', 'port': 5004}}
+        assert not any(isinstance(v, memoryview) for v in status.values())
+
+    def test_extended_length_field(self):
+        """A TLV with a multi-byte length is decoded and parsing continues after it"""
+        from ka9q.control import decode_status_tlv
+        from ka9q._status_decoder import _extended_len
+        description = 'x' * 300
+        buffer = bytearray([0, StatusType.DESCRIPTION, 0x82, 0x01, 0x2c])
+        buffer += description.encode()
+        encode_int(buffer, StatusType.OUTPUT_SSRC, 42)
+        buffer.append(StatusType.EOL)
+
+        status = decode_status_tlv(bytes(buffer))
+        assert status == {'description': description, 'ssrc': 42}
+        # A length cut short by the end of the packet uses what is there
+        assert _extended_len(b'\x00\x01', 1, 0x82) == (1, 2)
+
 
 class TestSetupStatusListener:
     """Tests for _setup_status_listener method"""
@@ -358,7 +643,13 @@ class TestSetupStatusListener:
                 # Verify socket options were set
                 mock_sock.setsockopt.assert_called()
                 mock_sock.bind.assert_called_once()
-                mock_sock.settimeout.assert_called_once_with(0.1)
+                # Status socket is non-blocking, from creation where supported
+                sock_type = mock_socket_class.call_args[0][1]
+                if getattr(socket, 'SOCK_NONBLOCK', 0):
+                    assert sock_type & socket.SOCK_NONBLOCK
+                    mock_sock.setblocking.assert_not_called()
+                else:
+                    mock_sock.setblocking.assert_called_once_with(False)
     
     def test_setup_joins_multicast_group(self):
         """Test that socket joins the multicast group"""
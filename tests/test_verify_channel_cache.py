@@ -0,0 +1,88 @@
+"""
+Tests for verify_channel()'s short-lived discovery cache
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+
+from ka9q.control import RadiodControl
+
+
+def channel(frequency):
+    ch = MagicMock()
+    ch.frequency = frequency
+    ch.preset = 'usb'
+    return ch
+
+
+class TestVerifyChannelCache:
+    """Tests for verify_channel() discovery reuse"""
+
+    def test_batch_verify_uses_one_discovery(self, mock_control):
+        """Verifying several channels in a row discovers once"""
+        found = {1001: channel(7.074e6), 1002: channel(14.074e6)}
+        with patch('ka9q.control.discover_channels', return_value=found) as discover:
+            assert mock_control.verify_channel(1001, 7.074e6)
+            assert mock_control.verify_channel(1002, 14.074e6)
+        assert discover.call_count == 1
+
+    def test_miss_rediscovers(self, mock_control):
+        """A channel absent from the snapshot is looked for again"""
+        with patch('ka9q.control.discover_channels',
+                   side_effect=[{1001: channel(7.074e6)},
+                                {1001: channel(7.074e6), 1002: channel(14.074e6)}]) as discover:
+            assert mock_control.verify_channel(1001)
+            assert mock_control.verify_channel(1002)
+        assert discover.call_count == 2
+
+    def test_frequency_mismatch_rediscovers(self, mock_control):
+        """A stale frequency in the snapshot does not fail verification"""
+        with patch('ka9q.control.discover_channels',
+                   side_effect=[{1001: channel(7.074e6)}, {1001: channel(10.0e6)}]) as discover:
+            assert mock_control.verify_channel(1001, 7.074e6)
+            assert mock_control.verify_channel(1001, 10.0e6)
+        assert discover.call_count == 2
+
+    def test_remove_channel_invalidates_entry(self, mock_control):
+        """A removed channel is not verified from the snapshot"""
+        with patch('ka9q.control.discover_channels',
+                   side_effect=[{1001: channel(7.074e6)}, {}]) as discover:
+            assert mock_control.verify_channel(1001)
+            mock_control.remove_channel(1001)
+            assert not mock_control.verify_channel(1001)
+        assert discover.call_count == 2
+
+    def test_snapshot_expires(self, mock_control):
+        """After the TTL the channel map is discovered again"""
+        found = {1001: channel(7.074e6)}
+        with patch('ka9q.control.discover_channels', return_value=found) as discover:
+            assert mock_control.verify_channel(1001)
+            mock_control._channel_cache_time -= RadiodControl._CHANNEL_CACHE_TTL + 0.1
+            assert mock_control.verify_channel(1001)
+        assert discover.call_count == 2
+
+    @pytest.mark.parametrize('retune', [
+        lambda control: control.set_frequency(1001, 10.0e6),
+        lambda control: control.set_preset(1001, 'lsb'),
+        lambda control: control.tune_many([{'ssrc': 1001, 'frequency_hz': 10.0e6}], timeout=0.05),
+        lambda control: control.tune(1001, frequency_hz=10.0e6, timeout=0.05),
+    ], ids=['set_frequency', 'set_preset', 'tune_many', 'tune'])
+    def test_retune_invalidates_entry(self, mock_control, retune):
+        """Retune-then-verify re-discovers instead of trusting the snapshot"""
+        with patch('ka9q.control.discover_channels',
+                   side_effect=[{1001: channel(7.074e6)}, {1001: channel(7.074e6)}]) as discover, \
+             patch('ka9q.control.select.select', return_value=([], [], [])):
+            assert mock_control.verify_channel(1001, 7.074e6)
+            try:
+                retune(mock_control)
+            except TimeoutError:
+                pass  # tune() gets no reply from the mocked socket
+            assert mock_control.verify_channel(1001, 7.074e6)
+        assert discover.call_count == 2
+
+    def test_other_setters_keep_snapshot(self, mock_control):
+        """Settings that verify_channel() does not check leave the snapshot alone"""
+        with patch('ka9q.control.discover_channels', return_value={1001: channel(7.074e6)}) as discover:
+            assert mock_control.verify_channel(1001)
+            mock_control.set_gain(1001, 10.0)
+            assert mock_control.verify_channel(1001)
+        assert discover.call_count == 1